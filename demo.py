@@ -7,60 +7,87 @@ without requiring the full web dashboard.
 """
 
 import time
+import random
 import sys
+from array import array
 from pathlib import Path
 
 # Add the current directory to the path
 sys.path.insert(0, str(Path(__file__).parent))
 
-try:
-    from trading_dashboard import TradingSimulator
-    SIMULATOR_AVAILABLE = True
-except ImportError:
-    print("⚠️  Warning: Full simulator not available, running basic demo...")
-    SIMULATOR_AVAILABLE = False
+from simple_demo import _wait_for_deadline
+
+# Resolved on first use so the --basic path never imports the dashboard
+SIMULATOR_AVAILABLE = None
+
+
+def _load_simulator() -> bool:
+    """Import the full simulator on demand and record whether it is available."""
+    global SIMULATOR_AVAILABLE
+    if SIMULATOR_AVAILABLE is None:
+        try:
+            import trading_dashboard  # noqa: F401
+            SIMULATOR_AVAILABLE = True
+        except ImportError:
+            print("⚠️  Warning: Full simulator not available, running basic demo...")
+            SIMULATOR_AVAILABLE = False
+    return SIMULATOR_AVAILABLE
+
+
+# Shared generator for the basic demo's price draws
+_RNG = random.Random()
+
+# Trend glyphs indexed by sign(change) + 1
+_ARROWS = ("📉", "➡️", "📈")
 
 
-def run_basic_demo():
-    """Run a basic demo with simple market data simulation."""
+def run_basic_demo(interval: float = 1.0):
+    """Run a basic demo with simple market data simulation.
+    
+    ``interval`` is the target wall-clock spacing between updates in
+    seconds; an interval of 0 runs them back to back.
+    """
     print("🚀 AI Trading Simulator - Basic Demo")
     print("=" * 50)
     
-    # Simulate basic market data
-    assets = {
-        'AAPL': {'price': 175.50, 'volume': 45000000},
-        'MSFT': {'price': 338.20, 'volume': 22000000},
-        'BTC': {'price': 43250.00, 'volume': 280000},
-    }
+    # Simulate basic market data: symbol ids index straight into the columns
+    symbols = ('AAPL', 'MSFT', 'BTC')
+    prices = array('d', (175.50, 338.20, 43250.00))
+    volumes = array('q', (45000000, 22000000, 280000))
     
     print("📊 Initial Market Data:")
-    for symbol, data in assets.items():
-        print(f"  {symbol}: ${data['price']:,.2f} | Volume: {data['volume']:,}")
+    for i, symbol in enumerate(symbols):
+        print(f"  {symbol}: ${prices[i]:,.2f} | Volume: {volumes[i]:,}")
     
     print("\n🔄 Simulating Market Movements...")
     
+    # Draw every update's moves up front: one row of ±2% changes per cycle
+    uniform = _RNG.uniform
+    moves = [[uniform(-0.02, 0.02) for _ in symbols] for _ in range(5)]
+    
     # Simulate some price movements
-    for i in range(5):
+    deadline = time.monotonic()
+    for i, changes in enumerate(moves):
         print(f"\n⏰ Update {i+1}:")
-        for symbol in assets:
-            # Simple random price movement
-            import random
-            change = random.uniform(-0.02, 0.02)  # ±2% change
-            old_price = assets[symbol]['price']
-            new_price = old_price * (1 + change)
-            assets[symbol]['price'] = new_price
-            
+        new_prices = array('d', [price * (1 + change) for price, change in zip(prices, changes)])
+        
+        for symbol, old_price, new_price, change in zip(symbols, prices, new_prices, changes):
             change_pct = (change * 100)
-            change_symbol = "📈" if change > 0 else "📉" if change < 0 else "➡️"
+            change_symbol = _ARROWS[(change > 0) - (change < 0) + 1]
             print(f"  {symbol}: ${old_price:,.2f} → ${new_price:,.2f} ({change_pct:+.2f}%) {change_symbol}")
         
-        time.sleep(1)  # Pause between updates
+        prices = new_prices
+        if interval > 0:
+            deadline += interval
+            _wait_for_deadline(deadline)
     
     print("\n✅ Basic demo completed!")
 
 
-def run_full_demo():
-    """Run the full simulator demo."""
+def run_full_demo(interval: float = 1.0):
+    """Run the full simulator demo, pacing its cycles like run_basic_demo."""
+    from trading_dashboard import TradingSimulator
+    
     print("🚀 AI Trading Simulator - Full Demo")
     print("=" * 50)
     
@@ -83,6 +110,7 @@ def run_full_demo():
     
     # Run simulation for a few cycles
     print("\n📈 Running Simulation (5 cycles)...")
+    deadline = time.monotonic()
     for i in range(5):
         simulator.update_market_data()
         status = simulator.get_status()
@@ -98,14 +126,16 @@ def run_full_demo():
                 if symbol in status['price_history'] and len(status['price_history'][symbol]) >= 2:
                     prices = status['price_history'][symbol]
                     if len(prices) >= 2:
-                        old_price = prices[-2]
-                        new_price = prices[-1]
+                        old_price = prices[-2]['price']
+                        new_price = prices[-1]['price']
                         change = new_price - old_price
                         change_pct = (change / old_price) * 100
-                        change_symbol = "📈" if change > 0 else "📉" if change < 0 else "➡️"
+                        change_symbol = _ARROWS[(change > 0) - (change < 0) + 1]
                         print(f"    {symbol}: ${old_price:,.2f} → ${new_price:,.2f} ({change_pct:+.2f}%) {change_symbol}")
         
-        time.sleep(1)
+        if interval > 0:
+            deadline += interval
+            _wait_for_deadline(deadline)
     
     print("\n🛑 Stopping Simulator...")
     simulator.stop()
@@ -122,20 +152,29 @@ def run_full_demo():
 
 def main():
     """Main demo function."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="AI trading simulator demo")
+    parser.add_argument("--basic", action="store_true",
+                        help="run the basic demo without the full simulator")
+    parser.add_argument("--interval", type=float, default=1.0,
+                        help="seconds between updates; 0 runs flat out (default: 1.0)")
+    args = parser.parse_args()
+    
     print("🎯 AI Trading Simulator - Demo Mode")
     print("=" * 50)
     
-    if len(sys.argv) > 1 and sys.argv[1] == "--basic":
-        run_basic_demo()
-    elif SIMULATOR_AVAILABLE:
+    if args.basic:
+        run_basic_demo(args.interval)
+    elif _load_simulator():
         try:
-            run_full_demo()
+            run_full_demo(args.interval)
         except Exception as e:
             print(f"\n❌ Error running full demo: {e}")
             print("🔄 Falling back to basic demo...")
-            run_basic_demo()
+            run_basic_demo(args.interval)
     else:
-        run_basic_demo()
+        run_basic_demo(args.interval)
     
     print("\n" + "=" * 50)
     print("🎉 Demo completed successfully!")
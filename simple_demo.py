@@ -4,9 +4,53 @@ Simple demo of the trading simulator core concepts.
 This version works without external dependencies.
 """
 
+import sys
 import time
 import random
-from datetime import datetime
+from array import array
+from functools import lru_cache
+
+
+# Shared generator for every simulated draw; one bound instance avoids the
+# module-level random.* wrappers on each call
+_RNG = random.Random()
+
+# Status row layout and how many rows to buffer before writing to stdout
+_ROW_TEMPLATE = "[{}] {}: {} | Volume: {:,} | VWAP: {} | Position: {} | P&L: {}"
+_FLUSH_EVERY = 5
+
+# Floor applied to every simulated volume
+_MIN_VOLUME = 100000
+
+
+@lru_cache(maxsize=8192)
+def _fmt_money(cents: int) -> str:
+    """Format an amount given in whole cents as ``$1,234.56``.
+    
+    Prices repeat often between ticks, so the formatted strings are cached
+    by their integer cent value.
+    """
+    return f"${cents / 100:,.2f}"
+
+
+# "HH:MM:" prefix of the last timestamp and the minute of day it belongs to
+_clock_minute = -1
+_clock_prefix = ""
+
+
+def _timestamp() -> str:
+    """Return the local wall-clock time as ``HH:MM:SS``.
+    
+    Ticks arrive about a second apart, so the hour/minute prefix is only
+    re-formatted when the minute rolls over.
+    """
+    global _clock_minute, _clock_prefix
+    t = time.localtime()
+    minute = t.tm_hour * 60 + t.tm_min
+    if minute != _clock_minute:
+        _clock_prefix = f"{t.tm_hour:02d}:{t.tm_min:02d}:"
+        _clock_minute = minute
+    return f"{_clock_prefix}{t.tm_sec:02d}"
 
 
 class SimpleMarketData:
@@ -18,58 +62,77 @@ class SimpleMarketData:
         self.volume = 1000000
         self.timestamp = time.time()
     
-    def generate_data(self):
-        """Generate simulated market data."""
+    def generate_data(self, price_change: float = None, volume_change: float = None):
+        """Generate simulated market data.
+        
+        Callers that pre-draw a whole random walk pass each tick's moves in;
+        otherwise they are drawn here.
+        """
         # Simulate price movement
-        price_change = random.uniform(-0.02, 0.02)  # ±2% change
+        if price_change is None:
+            price_change = _RNG.uniform(-0.02, 0.02)  # ±2% change
         self.current_price *= (1 + price_change)
         self.current_price = max(self.current_price, 1.0)
         
         # Simulate volume
-        volume_change = random.uniform(-0.1, 0.1)
-        self.volume = max(int(self.volume * (1 + volume_change)), 100000)
+        if volume_change is None:
+            volume_change = _RNG.uniform(-0.1, 0.1)
+        volume = int(self.volume * (1 + volume_change))
+        self.volume = volume if volume > _MIN_VOLUME else _MIN_VOLUME
         
         return {
             'symbol': self.symbol,
             'price': self.current_price,
             'volume': self.volume,
-            'timestamp': datetime.now().strftime('%H:%M:%S')
+            'timestamp': _timestamp()
         }
 
 
+def _vwap_step(total_volume: float, total_price_volume: float, price: float, volume: int):
+    """Fold one trade into the VWAP accumulators.
+    
+    Returns the updated ``(total_volume, total_price_volume, vwap)`` so the
+    per-tick numeric work stays in a single flat function call.
+    """
+    total_volume += volume
+    total_price_volume += price * volume
+    vwap = total_price_volume / total_volume if total_volume > 0 else 0.0
+    return total_volume, total_price_volume, vwap
+
+
 class SimpleVWAPStrategy:
     """Simplified VWAP strategy for demo."""
     
     def __init__(self, symbol: str):
         self.symbol = symbol
         self.position = 0
-        self.vwap_values = []
+        self.current_vwap = 0.0
+        self.updates = 0
         self.total_volume = 0
         self.total_price_volume = 0
         self.trades = 0
         self.pnl = 0.0
         
-    def update_vwap(self, price: float, volume: int):
-        """Update VWAP calculation."""
-        self.total_volume += volume
-        self.total_price_volume += price * volume
+    def update_vwap(self, price: float, volume: int) -> float:
+        """Update VWAP calculation and return the current VWAP."""
+        self.total_volume, self.total_price_volume, current_vwap = _vwap_step(
+            self.total_volume, self.total_price_volume, price, volume
+        )
         
         if self.total_volume > 0:
-            current_vwap = self.total_price_volume / self.total_volume
-            self.vwap_values.append(current_vwap)
-            
-            # Keep only last 10 values
-            if len(self.vwap_values) > 10:
-                self.vwap_values.pop(0)
+            self.current_vwap = current_vwap
+            self.updates += 1
+        
+        return self.current_vwap
     
     def generate_signal(self, current_price: float, volume: int):
         """Generate trading signal."""
-        self.update_vwap(current_price, volume)
+        current_vwap = self.update_vwap(current_price, volume)
         
-        if len(self.vwap_values) < 5:
+        # The running VWAP is only trusted after a short warm-up
+        if self.updates < 5:
             return None
         
-        current_vwap = self.vwap_values[-1]
         price_deviation = (current_price - current_vwap) / current_vwap
         
         # Simple signal logic
@@ -80,27 +143,131 @@ class SimpleVWAPStrategy:
         
         return None
     
-    def execute_trade(self, signal: str, price: float):
-        """Execute a trade."""
+    def execute_trade(self, signal: str, price: float, return_message: bool = False):
+        """Execute a trade.
+        
+        The description of the fill is only formatted when ``return_message``
+        is set; otherwise just the position and P&L are updated.
+        """
         if signal == "BUY" and self.position <= 0:
             quantity = 100
             self.position += quantity
             self.pnl -= price * quantity
             self.trades += 1
-            return f"Bought {quantity} shares at ${price:.2f}"
+            if return_message:
+                return f"Bought {quantity} shares at ${price:.2f}"
         
         elif signal == "SELL" and self.position >= 0:
             quantity = 100
             self.position -= quantity
             self.pnl += price * quantity
             self.trades += 1
-            return f"Sold {quantity} shares at ${price:.2f}"
+            if return_message:
+                return f"Sold {quantity} shares at ${price:.2f}"
         
         return None
 
 
-def run_simple_demo():
-    """Run the simple demo."""
+class SimpleMarket:
+    """Batch market engine holding every symbol's state in parallel columns.
+    
+    Instead of one market-data object and one strategy object per symbol,
+    each field lives in its own flat array indexed by symbol id, so a tick
+    advances the whole market in a single pass.
+    """
+    
+    def __init__(self, symbols, initial_prices, initial_volume: int = 1000000):
+        n = len(symbols)
+        self.symbols = tuple(symbols)
+        # Prices and the running VWAP and P&L accumulators are double
+        # precision (float32's ~7 significant digits drop cents at BTC-scale
+        # prices), and volumes are whole shares kept exact as 64-bit ints
+        self.prices = array('d', initial_prices)
+        self.volumes = array('q', [initial_volume] * n)
+        self.tot_v = array('d', [0.0] * n)
+        self.tot_pv = array('d', [0.0] * n)
+        self.positions = array('i', [0] * n)
+        self.pnl = array('d', [0.0] * n)
+        self.signals = array('b', [0] * n)  # Last step's codes: +1 buy, -1 sell, 0 hold
+        self.trades = 0
+        self.ticks = 0
+    
+    def vwap(self, i: int) -> float:
+        """Return the running VWAP for the symbol at index ``i``."""
+        return self.tot_pv[i] / self.tot_v[i] if self.tot_v[i] > 0 else 0.0
+    
+    def step(self, rng: random.Random = _RNG) -> int:
+        """Advance every symbol by one tick and apply the VWAP strategy.
+        
+        Price update, VWAP accumulation and signal evaluation are fused into
+        one pass, so each symbol's columns are visited once per step.
+        Returns the number of trades executed during the step.
+        """
+        prices = self.prices
+        volumes = self.volumes
+        tot_v = self.tot_v
+        tot_pv = self.tot_pv
+        positions = self.positions
+        pnl = self.pnl
+        signals = self.signals
+        uniform = rng.uniform
+        
+        self.ticks += 1
+        trading = self.ticks >= 5  # Let the VWAP warm up first
+        executed = 0
+        
+        for i in range(len(prices)):
+            price = max(prices[i] * (1 + uniform(-0.02, 0.02)), 1.0)
+            volume = int(volumes[i] * (1 + uniform(-0.1, 0.1)))
+            if volume < _MIN_VOLUME:
+                volume = _MIN_VOLUME
+            prices[i] = price
+            volumes[i] = volume
+            tot_v[i] += volume
+            tot_pv[i] += price * volume
+            
+            if not trading:
+                continue
+            
+            vwap = tot_pv[i] / tot_v[i]
+            price_deviation = (price - vwap) / vwap
+            
+            # Branchless signal: the buy and sell masks collapse into -1/0/+1
+            position = positions[i]
+            signal = ((price_deviation < -0.01) & (position <= 0)) - \
+                     ((price_deviation > 0.01) & (position >= 0))
+            signals[i] = signal
+            
+            quantity = signal * 100
+            positions[i] = position + quantity
+            pnl[i] -= quantity * price
+            executed += signal != 0
+        
+        self.trades += executed
+        return executed
+
+
+def _flush_rows(rows: list):
+    """Write the buffered status rows to stdout and empty the buffer."""
+    if rows:
+        sys.stdout.write("\n".join(rows) + "\n")
+        sys.stdout.flush()
+        rows.clear()
+
+
+def _wait_for_deadline(deadline: float):
+    """Sleep until the monotonic ``deadline``; return at once if it has passed."""
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def run_simple_demo(n_ticks: int = 20, interval: float = 1.0):
+    """Run the simple demo.
+    
+    ``interval`` is the target wall-clock spacing between ticks in seconds;
+    an interval of 0 runs the ticks back to back.
+    """
     print("🤖 Simple Trading Simulator Demo")
     print("=" * 50)
     
@@ -114,13 +281,18 @@ def run_simple_demo():
     print("📈 Real-time data will be displayed below:")
     print("-" * 80)
     
-    start_time = time.time()
+    # Draw the whole random walk up front instead of once per tick
+    uniform = _RNG.uniform
+    price_moves = [uniform(-0.02, 0.02) for _ in range(n_ticks)]
+    volume_moves = [uniform(-0.1, 0.1) for _ in range(n_ticks)]
     data_points = 0
+    rows = []
+    deadline = time.monotonic()
     
     try:
-        while time.time() - start_time < 20:  # Run for 20 seconds
+        for i in range(n_ticks):
             # Generate market data
-            data = market_data.generate_data()
+            data = market_data.generate_data(price_moves[i], volume_moves[i])
             
             # Generate trading signal
             signal = strategy.generate_signal(data['price'], data['volume'])
@@ -128,25 +300,34 @@ def run_simple_demo():
             # Execute trade if signal exists
             trade_result = None
             if signal:
-                trade_result = strategy.execute_trade(signal, data['price'])
+                trade_result = strategy.execute_trade(signal, data['price'], return_message=True)
             
-            # Display current status
-            current_vwap = strategy.vwap_values[-1] if strategy.vwap_values else 0
-            print(f"[{data['timestamp']}] AAPL: ${data['price']:.2f} | "
-                  f"Volume: {data['volume']:,} | "
-                  f"VWAP: ${current_vwap:.2f} | "
-                  f"Position: {strategy.position} | "
-                  f"P&L: ${strategy.pnl:.2f}")
+            # Buffer current status; rows are written out in batches
+            current_vwap = strategy.current_vwap
+            rows.append(_ROW_TEMPLATE.format(
+                data['timestamp'], data['symbol'], _fmt_money(round(data['price'] * 100)),
+                data['volume'], _fmt_money(round(current_vwap * 100)),
+                strategy.position, _fmt_money(round(strategy.pnl * 100))
+            ))
             
             if trade_result:
-                print(f"   💰 {trade_result}")
+                rows.append(f"   💰 {trade_result}")
             
             data_points += 1
-            time.sleep(1)
+            if data_points % _FLUSH_EVERY == 0:
+                _flush_rows(rows)
+            
+            if interval > 0:
+                deadline += interval
+                _wait_for_deadline(deadline)
             
     except KeyboardInterrupt:
+        # Rows from before the interrupt come out ahead of the notice
+        _flush_rows(rows)
         print("\n⏹️  Demo interrupted by user")
     
+    _flush_rows(rows)
+    
     # Display final results
     print("\n📊 Demo Results:")
     print("=" * 30)
@@ -155,8 +336,8 @@ def run_simple_demo():
     print(f"Final Position: {strategy.position}")
     print(f"Total P&L: ${strategy.pnl:.2f}")
     
-    if strategy.vwap_values:
-        print(f"Final VWAP: ${strategy.vwap_values[-1]:.2f}")
+    if strategy.updates:
+        print(f"Final VWAP: ${strategy.current_vwap:.2f}")
     
     print("\n🎉 Simple demo completed!")
     print("\n💡 This demonstrates:")
@@ -166,9 +347,71 @@ def run_simple_demo():
     print("   - Performance tracking")
 
 
+def run_batch_demo(n_ticks: int = 20, interval: float = 1.0):
+    """Run the multi-symbol demo on the batch market engine."""
+    print("🤖 Batch Trading Simulator Demo")
+    print("=" * 50)
+    
+    market = SimpleMarket(("AAPL", "MSFT", "BTC"), (175.50, 338.20, 43250.00))
+    
+    print("📊 Starting simulation...")
+    print("-" * 80)
+    
+    deadline = time.monotonic()
+    
+    try:
+        for _ in range(n_ticks):
+            executed = market.step()
+            
+            timestamp = _timestamp()
+            for i, symbol in enumerate(market.symbols):
+                print(f"[{timestamp}] {symbol}: {_fmt_money(round(market.prices[i] * 100))} | "
+                      f"VWAP: {_fmt_money(round(market.vwap(i) * 100))} | "
+                      f"Position: {market.positions[i]} | "
+                      f"P&L: {_fmt_money(round(market.pnl[i] * 100))}")
+            
+            if executed:
+                print(f"   💰 {executed} trade(s) executed")
+            
+            if interval > 0:
+                deadline += interval
+                _wait_for_deadline(deadline)
+            
+    except KeyboardInterrupt:
+        print("\n⏹️  Demo interrupted by user")
+    
+    print("\n📊 Demo Results:")
+    print("=" * 30)
+    print(f"Ticks Processed: {market.ticks}")
+    print(f"Total Trades: {market.trades}")
+    for i, symbol in enumerate(market.symbols):
+        print(f"{symbol}: Position {market.positions[i]} | P&L: ${market.pnl[i]:,.2f}")
+    
+    print("\n🎉 Batch demo completed!")
+
+
+def main():
+    """Command-line entry point for the terminal demo."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Simple trading simulator demo")
+    parser.add_argument("--ticks", type=int, default=20,
+                        help="number of simulated ticks to run (default: 20)")
+    parser.add_argument("--interval", type=float, default=1.0,
+                        help="seconds between ticks; 0 runs flat out (default: 1.0)")
+    parser.add_argument("--batch", action="store_true",
+                        help="run the multi-symbol batch engine demo")
+    args = parser.parse_args()
+    
+    if args.batch:
+        run_batch_demo(args.ticks, args.interval)
+    else:
+        run_simple_demo(args.ticks, args.interval)
+
+
 if __name__ == "__main__":
     try:
-        run_simple_demo()
+        main()
     except KeyboardInterrupt:
         print("\n\n⏹️  Demo interrupted by user")
     except Exception as e:
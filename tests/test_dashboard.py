@@ -0,0 +1,112 @@
+"""
+Tests for the dashboard simulator's running indicators and delta payloads.
+"""
+
+import http.client
+import http.server
+import json
+import math
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import trading_dashboard  # noqa: E402
+from trading_dashboard import TradingSimulator, TradingDashboardHandler  # noqa: E402
+
+
+def _started_simulator(ticks, seed=3):
+    simulator = TradingSimulator(seed=seed)
+    simulator.start()
+    for _ in range(ticks):
+        simulator.update_market_data()
+    return simulator
+
+
+def test_running_vwap_matches_recompute_over_window():
+    """Each asset's running VWAP equals a recompute over its last 20 samples."""
+    simulator = _started_simulator(150)
+    for i, symbol in enumerate(simulator._symbols):
+        window = list(simulator.price_history[symbol])[-trading_dashboard._VWAP_WINDOW:]
+        expected = sum(e['price'] * e['volume'] for e in window) / sum(e['volume'] for e in window)
+        assert math.isclose(simulator._vwaps[i], expected, rel_tol=1e-9)
+
+
+def test_tail_since_returns_entries_after_cursor():
+    """_tail_since keeps only entries newer than the cursor, oldest first."""
+    entries = [{'seq': seq} for seq in range(1, 8)]
+    assert TradingSimulator._tail_since(entries, 4) == [{'seq': 5}, {'seq': 6}, {'seq': 7}]
+    assert TradingSimulator._tail_since(entries, 7) == []
+    assert TradingSimulator._tail_since(entries, None) == entries
+
+
+def test_poll_payload_delta_holds_only_new_entries():
+    """A cursor one tick back gets just the latest history entries."""
+    simulator = _started_simulator(10)
+    full = json.loads(simulator.poll_payload()[0])
+    delta = json.loads(simulator.poll_payload(simulator.seq - 1)[0])
+
+    assert full['seq'] == delta['seq'] == simulator.seq
+    assert len(full['performance_history']) == 10
+    assert [e['seq'] for e in delta['performance_history']] == [simulator.seq]
+    assert all(len(history) == 1 for history in delta['price_history'].values())
+    assert delta['portfolio']['total_value'] == full['portfolio']['total_value']
+
+
+def test_poll_payload_cursor_from_the_future_gets_everything():
+    """A cursor past the current tick (a server restart) resends the full history."""
+    simulator = _started_simulator(5)
+    assert simulator.poll_payload(simulator.seq + 10) == simulator.poll_payload()
+
+
+def test_poll_payload_etag_is_stable_within_a_tick_and_changes_with_it():
+    """Payloads are shared within a tick; the next tick gets a new ETag."""
+    simulator = _started_simulator(3)
+    body, etag = simulator.poll_payload(2)
+    assert simulator.poll_payload(2) == (body, etag)
+    assert simulator.poll_payload(1)[1] != etag
+
+    simulator.update_market_data()
+    assert simulator.poll_payload(2)[1] != etag
+
+
+@pytest.fixture
+def server(monkeypatch):
+    simulator = _started_simulator(3)
+    monkeypatch.setattr(trading_dashboard, 'trading_simulator', simulator)
+    monkeypatch.setattr(TradingDashboardHandler, 'log_message', lambda *args: None)
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), TradingDashboardHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd, simulator
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _get(httpd, path, headers=None):
+    connection = http.client.HTTPConnection(*httpd.server_address)
+    connection.request("GET", path, headers=headers or {})
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response, body
+
+
+def test_status_revalidation_returns_304_until_the_next_tick(server):
+    """A matching If-None-Match gets a bodyless 304 until the simulator ticks."""
+    httpd, simulator = server
+    response, body = _get(httpd, "/api/status?since=2")
+    etag = response.getheader('ETag')
+    assert response.status == 200
+    assert json.loads(body)['seq'] == 3
+
+    response, body = _get(httpd, "/api/status?since=2", {'If-None-Match': etag})
+    assert response.status == 304
+    assert body == b''
+
+    simulator.update_market_data()
+    response, body = _get(httpd, "/api/status?since=2", {'If-None-Match': etag})
+    assert response.status == 200
+    assert [e['seq'] for e in json.loads(body)['performance_history']] == [3, 4]
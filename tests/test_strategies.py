@@ -0,0 +1,172 @@
+"""
+Tests for the advanced simulator's incremental strategy state.
+
+The strategies keep running window sums instead of recomputing each
+indicator from the window on every tick; these tests pin the sums to a
+from-scratch recomputation across window turnover and resyncs.
+"""
+
+import math
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from trading_simulator import (  # noqa: E402
+    AdvancedVWAPStrategy,
+    AdvancedTradingSimulator,
+    MeanReversionStrategy,
+    Signal,
+    SymbolState,
+    combine_signals,
+)
+
+
+def _close(a, b):
+    return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def _random_walk(n, seed=7, start=100.0, drift=0.0):
+    """Return ``n`` (price, volume) ticks of a seeded random walk."""
+    rng = random.Random(seed)
+    price = start
+    ticks = []
+    for _ in range(n):
+        price *= 1 + drift + rng.gauss(0, 0.01)
+        ticks.append((price, rng.randint(1000, 100000)))
+    return ticks
+
+
+def _wilder_rsi(prices, period):
+    """Reference Wilder RSI of the whole series, seeded with a simple average."""
+    changes = [b - a for a, b in zip(prices, prices[1:])]
+    gains = [max(c, 0.0) for c in changes]
+    losses = [max(-c, 0.0) for c in changes]
+    avg_gain = sum(gains[:period]) / period
+    avg_loss = sum(losses[:period]) / period
+    for gain, loss in zip(gains[period:], losses[period:]):
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+    if avg_loss == 0:
+        return 100.0
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+def _assert_vwap_sums_match_window(strategy):
+    prices = strategy.price_history
+    volumes = strategy.volume_history
+    returns = [(b - a) / a for a, b in zip(prices, prices[1:])]
+    assert _close(strategy.sum_pv, sum(p * v for p, v in zip(prices, volumes)))
+    assert strategy.sum_v == sum(volumes)
+    assert _close(strategy.sum_p, sum(prices))
+    assert _close(strategy.sum_ip, sum(i * p for i, p in enumerate(prices)))
+    assert _close(strategy.sum_r, sum(returns))
+    assert _close(strategy.sum_r2, sum(r * r for r in returns))
+
+
+@pytest.mark.parametrize("lookback", [5, 20])
+def test_vwap_running_sums_match_recompute_across_turnover(lookback):
+    """Running VWAP sums equal a recompute from the window on every tick."""
+    strategy = AdvancedVWAPStrategy("TEST", lookback)
+    for price, volume in _random_walk(lookback * 7 + 3):
+        strategy.generate_signal(price, volume)
+        _assert_vwap_sums_match_window(strategy)
+        # A resync runs once per full turnover, so evictions never reach n
+        assert strategy.evictions < lookback
+
+
+def test_vwap_indicators_match_reference_calculations():
+    """Recorded VWAP, momentum and volatility equal the from-window helpers."""
+    strategy = AdvancedVWAPStrategy("TEST", 20)
+    for price, volume in _random_walk(137):
+        strategy.generate_signal(price, volume)
+        prices = strategy.price_history
+        if len(prices) < 5:
+            continue
+        assert _close(strategy.vwap_values[-1], strategy.calculate_vwap(prices, strategy.volume_history))
+        assert _close(strategy.momentum_scores[-1], strategy.calculate_momentum(prices))
+        assert _close(strategy.volatility_scores[-1], strategy.calculate_volatility(prices))
+
+
+def test_vwap_running_sums_survive_long_drift():
+    """Sums stay exact over a long trending run thanks to the periodic resync."""
+    strategy = AdvancedVWAPStrategy("TEST", 20)
+    for price, volume in _random_walk(20000, drift=0.001):
+        strategy.generate_signal(price, volume)
+    _assert_vwap_sums_match_window(strategy)
+
+
+@pytest.mark.parametrize("period", [5, 20])
+def test_bollinger_running_sums_match_recompute_across_turnover(period):
+    """Running band sums equal a recompute from the window on every tick."""
+    strategy = MeanReversionStrategy("TEST", period)
+    for price, _ in _random_walk(period * 7 + 3):
+        strategy.generate_signal(price)
+        prices = strategy.price_history
+        assert _close(strategy.sum_p, sum(prices))
+        assert _close(strategy.sum_p2, sum(p * p for p in prices))
+        assert strategy.evictions < period
+
+
+def test_rsi_matches_reference_wilder_smoothing():
+    """The incremental RSI equals Wilder's RSI computed over the whole series."""
+    strategy = MeanReversionStrategy("TEST", 20, rsi_period=14)
+    seen = []
+    for price, _ in _random_walk(300):
+        strategy.generate_signal(price)
+        seen.append(price)
+        if len(seen) >= strategy.period and len(seen) > strategy.rsi_period:
+            assert _close(strategy.rsi_values[-1], _wilder_rsi(seen, strategy.rsi_period))
+
+
+def test_shared_state_matches_strategies_owning_their_state():
+    """Strategies reading a shared SymbolState give the same signals as standalone ones."""
+    vwap, mean_reversion = AdvancedVWAPStrategy("TEST"), MeanReversionStrategy("TEST")
+    state = SymbolState(20)
+    shared_vwap = AdvancedVWAPStrategy("TEST", 20, state=state)
+    shared_mean_reversion = MeanReversionStrategy("TEST", 20, state=state)
+    for price, volume in _random_walk(500):
+        expected = (vwap.generate_signal(price, volume), mean_reversion.generate_signal(price))
+        state.update(price, volume)
+        actual = (shared_vwap.generate_signal(price, volume), shared_mean_reversion.generate_signal(price))
+        assert actual == expected
+
+
+def test_strategy_window_longer_than_shared_state_is_rejected():
+    """A strategy cannot bind to a shared state shorter than its window."""
+    state = SymbolState(10)
+    with pytest.raises(ValueError):
+        AdvancedVWAPStrategy("TEST", 20, state=state)
+    with pytest.raises(ValueError):
+        MeanReversionStrategy("TEST", 11, state=state)
+
+
+def test_history_typecode_must_be_a_float_code():
+    """Only 'd' and 'f' are accepted as indicator history typecodes."""
+    assert AdvancedTradingSimulator(seed=1, history_typecode='f').history_typecode == 'f'
+    with pytest.raises(ValueError):
+        AdvancedTradingSimulator(seed=1, history_typecode='i')
+    with pytest.raises(ValueError):
+        MeanReversionStrategy("TEST", history_typecode='q')
+
+
+def test_combine_signals_on_lists():
+    """Agreement averages, a lone signal wins and opposite signals cancel."""
+    B, H, S = Signal.BUY, Signal.HOLD, Signal.SELL
+    vwap_signals = [B, S, B, H, B, H]
+    mr_signals = [B, S, H, S, S, H]
+    vwap_confidences = [0.4, 0.2, 0.7, 0.1, 0.9, 0.3]
+    mr_confidences = [0.6, 0.8, 0.2, 0.5, 0.4, 0.6]
+
+    signals, confidences = combine_signals(vwap_signals, mr_signals, vwap_confidences, mr_confidences)
+
+    assert signals == [B, S, B, S, H, H]
+    assert confidences == [0.5, 0.5, 0.7, 0.5, 0.9, 0.6]
+
+
+def test_combine_signals_on_empty_lists():
+    """No assets give no combined signals."""
+    assert combine_signals([], [], [], []) == ([], [])
@@ -4,22 +4,181 @@ AI Trading Simulator Dashboard
 Features: Real-time charts, multi-asset monitoring, interactive trading
 """
 
+import gzip
+import hashlib
 import http.server
-import socketserver
+import socket
 import json
 import time
 import random
 import threading
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter, itemgetter
 from datetime import datetime, timedelta
-from urllib.parse import urlparse
+from enum import IntEnum
+from urllib.parse import parse_qs, urlparse
 import math
 
+# orjson is optional: it serializes the status payload several times faster
+# than the stdlib encoder, which stays as the zero-dependency fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data):
+    """Serialize ``data`` to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+@lru_cache(maxsize=1024)
+def _isoformat(ts):
+    """Format an epoch timestamp as a local ISO 8601 string."""
+    return datetime.fromtimestamp(ts).isoformat()
+
+
+def _with_isoformat(entries):
+    """Copy history entries with their epoch ``timestamp`` formatted as ISO 8601."""
+    return [{**entry, 'timestamp': _isoformat(entry['timestamp'])} for entry in entries]
+
+
+class AssetType(IntEnum):
+    """Asset type codes; index the per-type lookup tables below."""
+    STOCK = 0
+    CRYPTO = 1
+    FOREX = 2
+    COMMODITY = 3
+    ETF = 4
+
+
+class Sector(IntEnum):
+    """Sector codes; index ``_SECTOR_VOLATILITY``."""
+    TECHNOLOGY = 0
+    AUTOMOTIVE = 1
+    DIGITAL_ASSETS = 2
+    CURRENCY = 3
+    PRECIOUS_METALS = 4
+    MARKET_INDEX = 5
+    OTHER = 6
+
+
+# Sector names as they appear in the assets table
+_SECTOR_CODES = {
+    'Technology': Sector.TECHNOLOGY,
+    'Automotive': Sector.AUTOMOTIVE,
+    'Digital Assets': Sector.DIGITAL_ASSETS,
+    'Currency': Sector.CURRENCY,
+    'Precious Metals': Sector.PRECIOUS_METALS,
+    'Market Index': Sector.MARKET_INDEX
+}
+
+# Base volatility by asset type: stock, crypto, forex, commodity, etf
+_BASE_VOLATILITY = (0.015, 0.035, 0.008, 0.012, 0.010)
+
+# Volatility adjustment for the prevailing market sentiment
+_SENTIMENT_MULTIPLIER = {
+    'bullish': 1.2,
+    'bearish': 1.3,
+    'neutral': 1.0
+}
+
+# Sector-specific volatility adjustments, indexed by Sector
+_SECTOR_VOLATILITY = (1.3, 1.4, 1.5, 0.8, 0.9, 0.7, 1.0)
+
+# Market news headlines and their possible impact
+_NEWS_EVENTS = (
+    "Fed announces interest rate decision",
+    "Tech earnings beat expectations",
+    "Oil prices surge on supply concerns",
+    "Crypto adoption increases",
+    "Market volatility spikes",
+    "Economic data shows strong growth",
+    "Trade tensions ease",
+    "Inflation data released"
+)
+_NEWS_IMPACTS = ('positive', 'negative', 'neutral')
+
+# Order size by signal strength (-2..2) and volume signal (-1..1): buys
+# scale with the signed volume signal, sells with its magnitude
+_TRADE_QUANTITY = tuple(
+    tuple(
+        int(1000 * strength * (1 + volume * 0.2)) if strength > 0
+        else int(1000 * abs(strength) * (1 + abs(volume) * 0.2))
+        for volume in (-1, 0, 1)
+    )
+    for strength in (-2, -1, 0, 1, 2)
+)
+
+# Order side indexed by (signal_strength > 0)
+_TRADE_SIDE = ("SELL", "BUY")
+
+# Longest a /api/status?wait=1 long poll is held open, in seconds
+LONG_POLL_TIMEOUT = 15.0
+
+# Idle seconds between keep-alive comments on the /api/stream event stream
+STREAM_KEEPALIVE = 15.0
+
+# Seconds an idle HTTP/1.1 connection is kept open for its next request
+KEEP_ALIVE_TIMEOUT = 60.0
+
+# Price points per symbol served to the dashboard's price chart
+PRICE_CHART_POINTS = 20
+
+# Number of most recent ticks the rolling VWAP covers
+_VWAP_WINDOW = 20
+
+# RSI lookback, in price changes
+_RSI_PERIOD = 14
+
+# Lowest price an asset type may trade at: stocks >= $1, crypto >= $0.01
+_PRICE_FLOOR = (1.0, 0.01, 0.0, 0.0, 0.0)
+
+
+@dataclass(slots=True)
+class Trade:
+    """A filled order; ``timestamp`` is epoch seconds, formatted on egress."""
+    id: int
+    seq: int  # Tick the trade was filled in
+    symbol: str
+    side: str  # BUY/SELL
+    quantity: int
+    price: float
+    timestamp: float
+    fees: float
+    pnl: float
+    vwap_at_trade: float
+    rsi_at_trade: float
+    
+    def to_dict(self):
+        """Return the JSON form served by the dashboard API."""
+        return {
+            'id': 'T%06d' % self.id,
+            'seq': self.seq,
+            'symbol': self.symbol,
+            'side': self.side,
+            'quantity': self.quantity,
+            'price': self.price,
+            'timestamp': _isoformat(self.timestamp),
+            'fees': self.fees,
+            'pnl': self.pnl,
+            'vwap_at_trade': self.vwap_at_trade,
+            'rsi_at_trade': self.rsi_at_trade
+        }
+
 
 class TradingSimulator:
     """Realistic trading simulator for the web dashboard."""
     
-    def __init__(self):
+    def __init__(self, seed=None):
         self.running = False
+        self._rng = random.Random(seed)  # Pass a seed for reproducible runs
         # Real-world asset data with realistic starting prices
         self.assets = {
             'AAPL': {'price': 175.50, 'volume': 45000000, 'type': 'stock', 'vwap': 175.50, 'rsi': 52.3, 'sector': 'Technology'},
@@ -43,206 +202,268 @@ class TradingSimulator:
             'max_drawdown': 0.0,
             'win_rate': 0.0,
             'positions': {},
-            'trades': [],
+            'trades': deque(maxlen=200),  # Last 200 Trade records
             'watchlist': ['AAPL', 'MSFT', 'NVDA', 'BTC'],
             'risk_level': 'moderate',  # conservative, moderate, aggressive
             'max_position_size': 0.15,  # 15% max per position
             'daily_loss_limit': 0.03    # 3% daily loss limit
         }
         
-        self.price_history = {symbol: [] for symbol in self.assets}
-        self.performance_history = []
+        # Bounded histories: deques drop their oldest entry in O(1)
+        self.price_history = {symbol: deque(maxlen=200) for symbol in self.assets}
+        self.performance_history = deque(maxlen=200)
         self.trade_count = 0
+        self._seq = 0  # Tick counter tagged on history entries for ?since= deltas
+        self._updated = threading.Condition()  # Notified after every tick and start/stop
+        
+        # Guards market state between the tick thread and request handlers
+        self.lock = threading.RLock()
+        
+        # Serialized get_status() payloads for the current tick, by cursor
+        self._status_cache_key = None
+        self._status_cache = {}
         self.market_sentiment = 'neutral'  # bullish, bearish, neutral
-        self.news_events = []
+        self.news_events = deque(maxlen=10)
+        
+        # Live market state as parallel columns indexed by a stable symbol id;
+        # self.assets keeps the static metadata and is refreshed on get_status()
+        self._symbols = list(self.assets)
+        self._index = {symbol: i for i, symbol in enumerate(self._symbols)}
+        self._prices = [self.assets[s]['price'] for s in self._symbols]
+        self._volumes = [self.assets[s]['volume'] for s in self._symbols]
+        self._vwaps = [self.assets[s]['vwap'] for s in self._symbols]
+        self._rsis = [self.assets[s]['rsi'] for s in self._symbols]
+        
+        # Integer type/sector codes, resolved once from the asset metadata
+        self._type_code = [AssetType[self.assets[s]['type'].upper()] for s in self._symbols]
+        self._sector_code = [_SECTOR_CODES.get(self.assets[s].get('sector'), Sector.OTHER) for s in self._symbols]
+        
+        # Per-symbol volatility factors and price floors, fixed at start-up
+        self._base_vol = [_BASE_VOLATILITY[code] for code in self._type_code]
+        self._sector_vol = [_SECTOR_VOLATILITY[code] for code in self._sector_code]
+        self._floor = [_PRICE_FLOOR[code] for code in self._type_code]
+        
+        # Rolling VWAP state: per-symbol circular buffers of the last
+        # _VWAP_WINDOW price*volume and volume samples, plus their running
+        # sums; volume confirmation also reads its window from here. Volumes
+        # are int64 since the random walk is unbounded
+        n = len(self._symbols)
+        self._pv_ring = [array('d', bytes(8 * _VWAP_WINDOW)) for _ in range(n)]
+        self._v_ring = [array('q', bytes(8 * _VWAP_WINDOW)) for _ in range(n)]
+        self._pv_sum = [0.0] * n
+        self._v_sum = [0] * n
+        self._ring_head = 0
+        
+        # Wilder-smoothed average gain and loss per symbol for the RSI
+        self._avg_gain = array('d', bytes(8 * n))
+        self._avg_loss = array('d', bytes(8 * n))
+        
+        # Running performance state: Welford mean/M2 of per-tick returns,
+        # the equity peak and the count of winning ticks
+        self._n_returns = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._peak = self.portfolio['total_value']
+        self._wins = 0
         
     def start(self):
         """Start the simulator."""
-        self.running = True
+        self._set_running(True)
         print("🚀 AI Trading Simulator Started!")
         
     def stop(self):
         """Stop the simulator."""
-        self.running = False
+        self._set_running(False)
         print("🛑 AI Trading Simulator Stopped")
+    
+    def _set_running(self, running):
+        """Set the run state and wake waiting clients so they see the change."""
+        with self.lock, self._updated:
+            self.running = running
+            self._updated.notify_all()
+        
+    def update_market_data(self, steps=1):
+        """Update market data with realistic movements.
         
-    def update_market_data(self):
-        """Update market data with realistic movements."""
+        ``steps`` price moves are compounded into a single update, so only
+        one history sample, indicator refresh and signal pass is produced.
+        """
         if not self.running:
             return
-            
+        with self.lock:
+            self._advance_market(steps)
+        
+        # Wake any clients waiting on this tick
+        with self._updated:
+            self._updated.notify_all()
+    
+    def _advance_market(self, steps):
+        """Apply one market update; the caller holds ``self.lock``."""
+        self._seq += 1
+        
         # Update market sentiment based on overall performance
         if len(self.performance_history) > 10:
-            recent_performance = [p['total_value'] for p in self.performance_history[-10:]]
-            if recent_performance[-1] > recent_performance[0] * 1.02:
+            first_value = self.performance_history[-10]['total_value']
+            last_value = self.performance_history[-1]['total_value']
+            if last_value > first_value * 1.02:
                 self.market_sentiment = 'bullish'
-            elif recent_performance[-1] < recent_performance[0] * 0.98:
+            elif last_value < first_value * 0.98:
                 self.market_sentiment = 'bearish'
             else:
                 self.market_sentiment = 'neutral'
         
-        # Generate realistic price movements based on asset type and market sentiment
-        for symbol, asset in self.assets.items():
-            # Base volatility by asset type
-            base_volatility = {
-                'stock': 0.015,
-                'crypto': 0.035,
-                'forex': 0.008,
-                'commodity': 0.012,
-                'etf': 0.010
-            }.get(asset['type'], 0.020)
-            
-            # Adjust volatility based on market sentiment
-            sentiment_multiplier = {
-                'bullish': 1.2,
-                'bearish': 1.3,
-                'neutral': 1.0
-            }.get(self.market_sentiment, 1.0)
-            
-            # Sector-specific volatility adjustments
-            sector_volatility = {
-                'Technology': 1.3,
-                'Automotive': 1.4,
-                'Digital Assets': 1.5,
-                'Currency': 0.8,
-                'Precious Metals': 0.9,
-                'Market Index': 0.7
-            }.get(asset.get('sector', 'Other'), 1.0)
-            
-            # Calculate final volatility
-            final_volatility = base_volatility * sentiment_multiplier * sector_volatility
-            
-            # Generate price movement with realistic distribution
-            if random.random() < 0.7:  # 70% normal movement
-                price_change = random.gauss(0, final_volatility)
-            else:  # 30% larger movement (market events)
-                price_change = random.gauss(0, final_volatility * 2)
-            
-            # Apply price change
-            new_price = asset['price'] * (1 + price_change)
+        # Adjust volatility based on market sentiment
+        sentiment_multiplier = _SENTIMENT_MULTIPLIER.get(self.market_sentiment, 1.0)
+        
+        # Draw every asset's shocks in one batch, a row per step: a standard
+        # normal move, a 30% chance of a doubled (market event) move, and a
+        # volume change
+        n = len(self._symbols)
+        gauss = self._rng.gauss
+        rand = self._rng.random
+        shocks = [[gauss(0, 1) for _ in range(n)] for _ in range(steps)]
+        event_scale = [[2.0 if rand() < 0.3 else 1.0 for _ in range(n)] for _ in range(steps)]
+        volume_shocks = [[gauss(0, 0.15) for _ in range(n)] for _ in range(steps)]
+        shock_cols = list(zip(*shocks))
+        event_cols = list(zip(*event_scale))
+        volume_cols = list(zip(*volume_shocks))
+        timestamp = time.time()
+        seq = self._seq
+        
+        prices = self._prices
+        volumes = self._volumes
+        vwaps = self._vwaps
+        rsis = self._rsis
+        pv_sum = self._pv_sum
+        v_sum = self._v_sum
+        avg_gain = self._avg_gain
+        avg_loss = self._avg_loss
+        head = self._ring_head
+        
+        for i, symbol in enumerate(self._symbols):
+            # Volatility from asset type, sector and sentiment
+            sigma = self._base_vol[i] * sentiment_multiplier * self._sector_vol[i]
             
-            # Ensure prices stay realistic
-            if asset['type'] == 'stock':
-                new_price = max(new_price, 1.0)  # Stocks can't go below $1
-            elif asset['type'] == 'crypto':
-                new_price = max(new_price, 0.01)  # Crypto can't go below $0.01
+            # Compound the batch's moves, keeping the final price realistic
+            growth = 1.0
+            for shock, scale in zip(shock_cols[i], event_cols[i]):
+                growth *= 1 + shock * (sigma * scale)
+            new_price = max(prices[i] * growth, self._floor[i])
             
-            # Update price history with timestamp
-            self.price_history[symbol].append({
+            # Update price history with an epoch timestamp
+            history = self.price_history[symbol]
+            history.append({
                 'price': new_price,
-                'timestamp': datetime.now().isoformat(),
-                'volume': asset['volume'],
-                'vwap': asset['vwap'],
-                'rsi': asset['rsi']
+                'timestamp': timestamp,
+                'volume': volumes[i],
+                'vwap': vwaps[i],
+                'rsi': rsis[i],
+                'seq': seq
             })
             
-            # Keep only last 200 data points for better charts
-            if len(self.price_history[symbol]) > 200:
-                self.price_history[symbol].pop(0)
-            
-            # Update VWAP with realistic calculation
-            if len(self.price_history[symbol]) > 0:
-                recent_data = self.price_history[symbol][-20:]  # Last 20 data points
-                total_pv = sum(d['price'] * d['volume'] for d in recent_data)
-                total_volume = sum(d['volume'] for d in recent_data)
-                asset['vwap'] = total_pv / total_volume if total_volume > 0 else new_price
+            # Update VWAP over the last 20 data points: add the new sample to
+            # the running sums and drop the one leaving the window
+            pv_ring = self._pv_ring[i]
+            v_ring = self._v_ring[i]
+            pv = new_price * volumes[i]
+            pv_sum[i] += pv - pv_ring[head]
+            v_sum[i] += volumes[i] - v_ring[head]
+            pv_ring[head] = pv
+            v_ring[head] = volumes[i]
+            vwaps[i] = pv_sum[i] / v_sum[i] if v_sum[i] > 0 else new_price
             
-            # Update RSI with realistic momentum
-            if len(self.price_history[symbol]) > 14:
-                asset['rsi'] = self._calculate_rsi([d['price'] for d in self.price_history[symbol]])
+            # Update RSI with realistic momentum: Wilder's smoothing, seeded
+            # with the simple average of the first _RSI_PERIOD changes
+            change = new_price - prices[i]
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            if seq <= _RSI_PERIOD:
+                avg_gain[i] += gain / _RSI_PERIOD
+                avg_loss[i] += loss / _RSI_PERIOD
+            else:
+                avg_gain[i] = (avg_gain[i] * (_RSI_PERIOD - 1) + gain) / _RSI_PERIOD
+                avg_loss[i] = (avg_loss[i] * (_RSI_PERIOD - 1) + loss) / _RSI_PERIOD
+            if seq >= _RSI_PERIOD:
+                rsis[i] = 100.0 if avg_loss[i] == 0 else 100 - 100 / (1 + avg_gain[i] / avg_loss[i])
             
-            # Update volume with realistic patterns
-            volume_change = random.gauss(0, 0.15)  # Normal distribution for volume
-            new_volume = max(int(asset['volume'] * (1 + volume_change)), 1000)
-            asset['volume'] = new_volume
+            # Update volume with realistic patterns, compounding the steps
+            volume = volumes[i]
+            for shock in volume_cols[i]:
+                volume = max(int(volume * (1 + shock)), 1000)
+            volumes[i] = volume
             
             # Update price
-            asset['price'] = new_price
-            
-            # Generate trading signals with enhanced logic
-            self._generate_trading_signals(symbol, asset)
+            prices[i] = new_price
+        
+        self._ring_head = (head + 1) % _VWAP_WINDOW
+        
+        # Generate trading signals with enhanced logic
+        self._generate_trading_signals()
         
         # Update portfolio and generate news events
         self._update_portfolio()
         self._generate_news_events()
-        
-    def _calculate_rsi(self, prices, period=14):
-        """Calculate RSI with realistic smoothing."""
-        if len(prices) < period + 1:
-            return 50.0
-        
-        gains = []
-        losses = []
-        
-        for i in range(1, len(prices)):
-            change = prices[i] - prices[i-1]
-            if change > 0:
-                gains.append(change)
-                losses.append(0)
-            else:
-                gains.append(0)
-                losses.append(abs(change))
-        
-        # Use exponential moving average for more realistic RSI
-        avg_gain = sum(gains[-period:]) / period
-        avg_loss = sum(losses[-period:]) / period
-        
-        if avg_loss == 0:
-            return 100.0
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return rsi
     
-    def _generate_trading_signals(self, symbol, asset):
-        """Generate enhanced trading signals."""
-        price = asset['price']
-        vwap = asset['vwap']
-        rsi = asset['rsi']
-        
-        # Enhanced signal generation with multiple factors
-        vwap_deviation = (price - vwap) / vwap if vwap > 0 else 0
-        rsi_signal = 0
+    def simulate_batch(self, k):
+        """Advance the market ``k`` steps at once, emitting one history sample."""
+        self.update_market_data(steps=k)
+    
+    @property
+    def seq(self):
+        """Number of the latest tick, the cursor for ``since`` deltas."""
+        return self._seq
+    
+    def wait_for_update(self, since, timeout=None):
+        """Block until a tick newer than ``since`` exists, the simulator is
+        started or stopped, or ``timeout`` expires.
         
-        # RSI signals with realistic thresholds
-        if rsi < 25:  # Strong oversold
-            rsi_signal = 2
-        elif rsi < 35:  # Oversold
-            rsi_signal = 1
-        elif rsi > 75:  # Strong overbought
-            rsi_signal = -2
-        elif rsi > 65:  # Overbought
-            rsi_signal = -1
+        Returns True when the simulator has moved past ``since`` or changed
+        its run state.
+        """
+        with self._updated:
+            running = self.running
+            return self._updated.wait_for(lambda: self._seq != since or self.running != running, timeout)
         
-        # Volume confirmation
-        volume_signal = 0
-        if len(self.price_history[symbol]) > 5:
-            recent_volume = [d['volume'] for d in self.price_history[symbol][-5:]]
-            avg_volume = sum(recent_volume) / len(recent_volume)
-            if asset['volume'] > avg_volume * 1.5:  # High volume
-                volume_signal = 1
-            elif asset['volume'] < avg_volume * 0.5:  # Low volume
-                volume_signal = -1
+    def _generate_trading_signals(self):
+        """Generate enhanced trading signals for every asset in one pass.
         
-        # Combined signal strength
-        signal_strength = 0
-        if vwap_deviation < -0.02 and rsi_signal >= 1:  # Strong buy
-            signal_strength = 2
-        elif vwap_deviation < -0.01 and rsi_signal >= 1:  # Buy
-            signal_strength = 1
-        elif vwap_deviation > 0.02 and rsi_signal <= -1:  # Strong sell
-            signal_strength = -2
-        elif vwap_deviation > 0.01 and rsi_signal <= -1:  # Sell
-            signal_strength = -1
+        The RSI, VWAP and volume thresholds are summed as booleans rather than
+        branched on; only assets with a non-zero signal reach the trade path.
+        """
+        signals = []
+        for i, (price, vwap, rsi) in enumerate(zip(self._prices, self._vwaps, self._rsis)):
+            # Enhanced signal generation with multiple factors
+            vwap_deviation = (price - vwap) / vwap if vwap > 0 else 0
+            
+            # RSI signals with realistic thresholds: +2 strong oversold (<25),
+            # +1 oversold (<35), -1 overbought (>65), -2 strong overbought (>75)
+            rsi_signal = (rsi < 25) + (rsi < 35) - (rsi > 75) - (rsi > 65)
+            
+            # Combined signal strength: +/-2 beyond 2% from VWAP, +/-1 beyond
+            # 1%, only when the RSI signal points the same way
+            signal_strength = (
+                (rsi_signal >= 1) * ((vwap_deviation < -0.02) + (vwap_deviation < -0.01))
+                - (rsi_signal <= -1) * ((vwap_deviation > 0.02) + (vwap_deviation > 0.01))
+            )
+            if signal_strength:
+                signals.append((i, signal_strength))
         
         # Execute trades based on signal strength and risk management
-        if signal_strength >= 1:
-            quantity = int(1000 * signal_strength * (1 + volume_signal * 0.2))
-            self._execute_trade(symbol, "BUY", quantity, price)
-        elif signal_strength <= -1:
-            quantity = int(1000 * abs(signal_strength) * (1 + abs(volume_signal) * 0.2))
-            self._execute_trade(symbol, "SELL", quantity, price)
+        head = self._ring_head  # Slot after the newest sample
+        for i, signal_strength in signals:
+            symbol = self._symbols[i]
+            price = self._prices[i]
+            
+            # Volume confirmation: +1 on high volume, -1 on low volume
+            volume_signal = 0
+            if self._seq > 5:
+                v_ring = self._v_ring[i]
+                avg_volume = sum(v_ring[(head - k) % _VWAP_WINDOW] for k in range(1, 6)) / 5
+                volume = self._volumes[i]
+                volume_signal = (volume > avg_volume * 1.5) - (volume < avg_volume * 0.5)
+            
+            quantity = _TRADE_QUANTITY[signal_strength + 2][volume_signal + 1]
+            self._execute_trade(symbol, _TRADE_SIDE[signal_strength > 0], quantity, price)
     
     def _execute_trade(self, symbol, side, quantity, price):
         """Execute trade with enhanced risk management."""
@@ -273,37 +494,27 @@ class TradingSimulator:
         """Record trade with enhanced details."""
         self.trade_count += 1
         
+        i = self._index[symbol]
+        vwap = self._vwaps[i]
+        
         # Calculate P&L for this trade
         pnl = 0
         if side == "SELL" and symbol in self.portfolio['positions']:
             # Simplified P&L calculation
-            pnl = quantity * (price - self.assets[symbol]['vwap'])
+            pnl = quantity * (price - vwap)
         
-        trade = {
-            'id': f"T{self.trade_count:06d}",
-            'symbol': symbol,
-            'side': side,
-            'quantity': quantity,
-            'price': price,
-            'timestamp': datetime.now().isoformat(),
-            'fees': fees,
-            'pnl': pnl,
-            'vwap_at_trade': self.assets[symbol]['vwap'],
-            'rsi_at_trade': self.assets[symbol]['rsi']
-        }
-        self.portfolio['trades'].append(trade)
-        
-        # Keep only last 200 trades
-        if len(self.portfolio['trades']) > 200:
-            self.portfolio['trades'].pop(0)
+        self.portfolio['trades'].append(Trade(
+            self.trade_count, self._seq, symbol, side, quantity, price, time.time(),
+            fees, pnl, vwap, self._rsis[i]
+        ))
     
     def _update_portfolio(self):
         """Update portfolio with enhanced metrics."""
         total_value = self.portfolio['cash']
         
         for symbol, quantity in self.portfolio['positions'].items():
-            if quantity != 0 and symbol in self.assets:
-                price = self.assets[symbol]['price']
+            if quantity != 0 and symbol in self._index:
+                price = self._prices[self._index[symbol]]
                 total_value += quantity * price
         
         self.portfolio['total_value'] = total_value
@@ -312,95 +523,161 @@ class TradingSimulator:
         if self.performance_history:
             last_value = self.performance_history[-1]['total_value']
             self.portfolio['daily_pnl'] = total_value - last_value
+            self._calculate_performance_metrics(last_value, total_value)
         else:
             self.portfolio['daily_pnl'] = 0.0
         
         # Update performance history
         self.performance_history.append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.time(),
             'total_value': total_value,
             'cash': self.portfolio['cash'],
-            'market_sentiment': self.market_sentiment
+            'market_sentiment': self.market_sentiment,
+            'seq': self._seq
         })
-        
-        # Keep only last 200 data points
-        if len(self.performance_history) > 200:
-            self.performance_history.pop(0)
-        
-        # Calculate performance metrics
-        self._calculate_performance_metrics()
     
-    def _calculate_performance_metrics(self):
-        """Calculate enhanced performance metrics."""
-        if len(self.performance_history) < 2:
-            return
-        
-        # Calculate returns
-        returns = []
-        for i in range(1, len(self.performance_history)):
-            prev_value = self.performance_history[i-1]['total_value']
-            curr_value = self.performance_history[i]['total_value']
-            if prev_value > 0:
-                returns.append((curr_value - prev_value) / prev_value)
-        
-        if returns:
-            # Enhanced Sharpe ratio
-            mean_return = sum(returns) / len(returns)
-            variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-            std_return = math.sqrt(variance) if variance > 0 else 0
-            self.portfolio['sharpe_ratio'] = mean_return / std_return if std_return > 0 else 0
+    def _calculate_performance_metrics(self, prev_value, curr_value):
+        """Fold one new portfolio value into the running performance metrics."""
+        if prev_value > 0:
+            # Welford update of the return mean and sum of squared deviations
+            r = (curr_value - prev_value) / prev_value
+            self._n_returns += 1
+            delta = r - self._mean
+            self._mean += delta / self._n_returns
+            self._m2 += delta * (r - self._mean)
+            self._wins += r > 0
             
-            # Max drawdown with time tracking
-            peak = self.performance_history[0]['total_value']
-            max_dd = 0
-            for metric in self.performance_history:
-                if metric['total_value'] > peak:
-                    peak = metric['total_value']
-                dd = (peak - metric['total_value']) / peak
-                max_dd = max(max_dd, dd)
-            self.portfolio['max_drawdown'] = max_dd
-            
-            # Win rate calculation
-            winning_days = sum(1 for r in returns if r > 0)
-            self.portfolio['win_rate'] = winning_days / len(returns) if returns else 0
+            variance = self._m2 / self._n_returns
+            std_return = math.sqrt(variance) if variance > 0 else 0
+            self.portfolio['sharpe_ratio'] = self._mean / std_return if std_return > 0 else 0
+            self.portfolio['win_rate'] = self._wins / self._n_returns
+        
+        # Max drawdown against the running peak
+        if curr_value > self._peak:
+            self._peak = curr_value
+        if self._peak > 0:
+            dd = (self._peak - curr_value) / self._peak
+            if dd > self.portfolio['max_drawdown']:
+                self.portfolio['max_drawdown'] = dd
     
     def _generate_news_events(self):
         """Generate realistic market news events."""
-        if random.random() < 0.1:  # 10% chance per update
-            events = [
-                "Fed announces interest rate decision",
-                "Tech earnings beat expectations",
-                "Oil prices surge on supply concerns",
-                "Crypto adoption increases",
-                "Market volatility spikes",
-                "Economic data shows strong growth",
-                "Trade tensions ease",
-                "Inflation data released"
-            ]
-            
-            event = random.choice(events)
-            timestamp = datetime.now().isoformat()
+        rng = self._rng
+        if rng.random() < 0.1:  # 10% chance per update
+            event = rng.choice(_NEWS_EVENTS)
+            timestamp = time.time()
             
             self.news_events.append({
                 'event': event,
                 'timestamp': timestamp,
-                'impact': random.choice(['positive', 'negative', 'neutral'])
+                'impact': rng.choice(_NEWS_IMPACTS),
+                'seq': self._seq
             })
-            
-            # Keep only last 10 news events
-            if len(self.news_events) > 10:
-                self.news_events.pop(0)
     
-    def get_status(self):
-        """Get comprehensive simulator status."""
+    def _sync_assets(self):
+        """Copy the live price columns back into the ``assets`` table."""
+        for symbol, price, volume, vwap, rsi in zip(
+            self._symbols, self._prices, self._volumes, self._vwaps, self._rsis
+        ):
+            asset = self.assets[symbol]
+            asset['price'] = price
+            asset['volume'] = volume
+            asset['vwap'] = vwap
+            asset['rsi'] = rsi
+    
+    def _history_since(self, history, since):
+        """Return the entries of ``history`` tagged with a seq after ``since``.
+        
+        Every tick appends exactly one entry, so the new entries are the last
+        ``self._seq - since`` items and can be sliced off the tail.
+        """
+        if since is None or since > self._seq:
+            return list(history)
+        count = self._seq - since
+        if count >= len(history):
+            return list(history)
+        return list(islice(history, len(history) - count, None))
+    
+    def poll_payload(self, since=None, compressed=False):
+        """Return ``get_status(since)`` serialized, as ``(body, etag)``.
+        
+        Each payload is built once per tick and cursor, then shared by every
+        /api/status, /api/poll and /api/stream client that asks for it. With
+        ``compressed`` the body is gzipped, likewise at most once per tick.
+        """
+        with self.lock:
+            # Cursors at or before the oldest retained entry all get the full history
+            if since is not None and not 0 <= self._seq - since < self.performance_history.maxlen:
+                since = None
+            key = (self._seq, self.running)
+            if key != self._status_cache_key:
+                self._status_cache = {}
+                self._status_cache_key = key
+            payload = self._status_cache.get((since, compressed))
+            if payload is None:
+                if compressed:
+                    body, etag = self.poll_payload(since)
+                    payload = (gzip.compress(body, compresslevel=1), etag[:-1] + '-gzip"')
+                else:
+                    body = self._encode_status(since)
+                    payload = (body, '"%s"' % hashlib.md5(body).hexdigest())
+                self._status_cache[(since, compressed)] = payload
+            return payload
+    
+    def _encode_status(self, since):
+        """Serialize ``get_status(since)``, reusing this tick's shared fields.
+        
+        Only the trades, histories and news events depend on the cursor; the
+        assets, portfolio figures and the rest are encoded once per tick and
+        spliced into every cursor's payload as bytes. Call with the lock held.
+        """
+        status = self.get_status(since)
+        portfolio = status.pop('portfolio')
+        trades = portfolio.pop('trades')
+        deltas = {key: status.pop(key) for key in ('price_history', 'performance_history', 'news_events')}
+        shared = self._status_cache.get('shared')
+        if shared is None:
+            shared = self._status_cache['shared'] = (_dumps(status)[:-1], _dumps(portfolio)[:-1])
+        head, portfolio_head = shared
+        return b'%s,"portfolio":%s,"trades":%s},%s' % (head, portfolio_head, _dumps(trades), _dumps(deltas)[1:])
+    
+    @staticmethod
+    def _tail_since(entries, since, key=itemgetter('seq')):
+        """Return the trailing entries whose seq is after ``since``, oldest first."""
+        if since is None:
+            return list(entries)
+        tail = []
+        for entry in reversed(entries):
+            if key(entry) <= since:
+                break
+            tail.append(entry)
+        tail.reverse()
+        return tail
+    
+    def get_status(self, since=None):
+        """Get comprehensive simulator status.
+        
+        With ``since`` set to a previously returned ``seq`` the response is a
+        delta: the histories, trades and news events only hold entries newer
+        than that tick, for the client to append to what it already has.
+        """
+        if since is not None and since > self._seq:
+            since = None  # Cursor from before a restart: resend everything
+        self._sync_assets()
+        trades = self._tail_since(self.portfolio['trades'], since, attrgetter('seq'))
+        # Price charts only plot the most recent points, so never send more
+        price_since = self._seq - PRICE_CHART_POINTS
+        if since is not None and since > price_since:
+            price_since = since
         return {
             "running": self.running,
             "assets": self.assets,
-            "portfolio": self.portfolio,
-            "price_history": self.price_history,
-            "performance_history": self.performance_history,
+            "portfolio": {**self.portfolio, 'trades': [trade.to_dict() for trade in trades]},
+            "price_history": {symbol: _with_isoformat(self._history_since(history, price_since)) for symbol, history in self.price_history.items()},
+            "performance_history": _with_isoformat(self._history_since(self.performance_history, since)),
             "market_sentiment": self.market_sentiment,
-            "news_events": self.news_events,
+            "news_events": _with_isoformat(self._tail_since(self.news_events, since)),
+            "seq": self._seq,
             "timestamp": datetime.now().strftime("%H:%M:%S")
         }
 
@@ -408,31 +685,9 @@ class TradingSimulator:
 # Global simulator instance
 trading_simulator = TradingSimulator()
 
-
-class TradingDashboardHandler(http.server.SimpleHTTPRequestHandler):
-    """HTTP handler for the trading dashboard."""
-    
-    def do_GET(self):
-        """Handle GET requests."""
-        parsed_url = urlparse(self.path)
-        path = parsed_url.path
-        
-        if path == "/":
-            self.send_dashboard()
-        elif path == "/api/status":
-            self.send_api_response(trading_simulator.get_status())
-        elif path == "/api/start":
-            trading_simulator.start()
-            self.send_api_response({"message": "Trading simulator started"})
-        elif path == "/api/stop":
-            trading_simulator.stop()
-            self.send_api_response({"message": "Trading simulator stopped"})
-        else:
-            self.send_error(404, "Not found")
-    
-    def send_dashboard(self):
-        """Send the main dashboard HTML."""
-        html = """
+# Dashboard page, encoded once at import time; the ETag lets browsers
+# revalidate it with a bodyless 304
+_DASHBOARD_HTML = """
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -797,9 +1052,29 @@ class TradingDashboardHandler(http.server.SimpleHTTPRequestHandler):
             </div>
             
             <script>
-                let updateInterval = null;
+                let running = false;  // Last reported simulator state
+                let polling = false;
+                let idleInterval = null;
+                let currentIntervalMs = 0;
+                let inflight = null;  // AbortController of the newest status request
+                let eventSource = null;
                 let performanceChart = null;
                 let priceChart = null;
+                let refs = null;  // Elements updated on every tick, looked up once
+                
+                // Formatted time labels by timestamp; toLocaleTimeString is slow
+                // and the same timestamps are rendered tick after tick
+                const _tsCache = new Map();
+                
+                function fmtTs(ts) {
+                    let label = _tsCache.get(ts);
+                    if (label === undefined) {
+                        label = new Date(ts).toLocaleTimeString();
+                        _tsCache.set(ts, label);
+                        if (_tsCache.size > 500) _tsCache.delete(_tsCache.keys().next().value);
+                    }
+                    return label;
+                }
                 
                 // Initialize charts
                 function initializeCharts() {
@@ -875,92 +1150,248 @@ class TradingDashboardHandler(http.server.SimpleHTTPRequestHandler):
                     });
                 }
                 
-                function updateDashboard() {
-                    fetch('/api/status')
+                // Local copies of the server histories, extended with the
+                // deltas returned by /api/status?since=<seq>
+                const HISTORY_LIMIT = 200;
+                const PRICE_LIMIT = 20;
+                const TRADES_LIMIT = 200;
+                const NEWS_LIMIT = 10;
+                let historySeq = null;
+                let performanceHistory = [];
+                let priceHistory = {};
+                let tradesLog = [];
+                let newsLog = [];
+                
+                function mergeHistory(local, delta, limit = HISTORY_LIMIT) {
+                    // Skip entries already held, e.g. after a stream reconnect
+                    const last = local.length ? local[local.length - 1].seq : -1;
+                    const merged = local.concat(delta.filter(entry => entry.seq > last));
+                    return merged.length > limit ? merged.slice(-limit) : merged;
+                }
+                
+                function updateDashboard(wait) {
+                    let url = '/api/poll';
+                    if (historySeq !== null) {
+                        url += '?since=' + historySeq + (wait ? '&wait=1' : '');
+                    }
+                    // A newer request supersedes the previous one, so a slow
+                    // response can never overwrite a fresher render
+                    if (inflight) inflight.abort();
+                    const controller = inflight = new AbortController();
+                    return fetch(url, { signal: controller.signal })
                         .then(response => response.json())
                         .then(data => {
-                            // Update status
-                            const statusDiv = document.getElementById('status');
-                            statusDiv.textContent = data.running ? 'RUNNING' : 'STOPPED';
-                            statusDiv.className = 'status ' + (data.running ? 'running' : 'stopped');
-                            
-                            // Update market sentiment
-                            updateMarketSentiment(data.market_sentiment);
-                            
-                            // Update portfolio metrics
-                            document.getElementById('totalValue').textContent = '$' + data.portfolio.total_value.toLocaleString();
-                            document.getElementById('dailyPnl').textContent = '$' + data.portfolio.daily_pnl.toLocaleString();
-                            document.getElementById('totalPnl').textContent = '$' + data.portfolio.total_pnl.toLocaleString();
-                            document.getElementById('sharpeRatio').textContent = data.portfolio.sharpe_ratio.toFixed(3);
-                            document.getElementById('maxDrawdown').textContent = (data.portfolio.max_drawdown * 100).toFixed(2) + '%';
-                            document.getElementById('winRate').textContent = (data.portfolio.win_rate * 100).toFixed(2) + '%';
-                            document.getElementById('totalTrades').textContent = data.portfolio.trades.length;
-                            document.getElementById('activePositions').textContent = Object.keys(data.portfolio.positions).length;
-                            document.getElementById('cash').textContent = '$' + data.portfolio.cash.toLocaleString();
-                            
-                            // Update asset grid
-                            updateAssetGrid(data.assets);
-                            
-                            // Update trades list
-                            updateTradesList(data.portfolio.trades);
-                            
-                            // Update news events
-                            updateNewsEvents(data.news_events);
-                            
-                            // Update charts
-                            updateCharts(data);
+                            renderStatus(data);
+                            return true;
+                        })
+                        .catch(error => {
+                            if (error.name === 'AbortError') return null;
+                            console.error('Error fetching status:', error);
+                            return false;
                         })
-                        .catch(error => console.error('Error fetching status:', error));
+                        .finally(() => {
+                            if (inflight === controller) inflight = null;
+                        });
+                }
+                
+                function renderStatus(data) {
+                    if (historySeq === null || data.seq < historySeq) {
+                        // First load or server restart: take the full history
+                        if (historySeq !== null) resetCharts();
+                        performanceHistory = data.performance_history;
+                        priceHistory = data.price_history;
+                        tradesLog = data.portfolio.trades;
+                        newsLog = data.news_events;
+                    } else {
+                        performanceHistory = mergeHistory(performanceHistory, data.performance_history);
+                        for (const [symbol, delta] of Object.entries(data.price_history)) {
+                            priceHistory[symbol] = mergeHistory(priceHistory[symbol] || [], delta, PRICE_LIMIT);
+                        }
+                        tradesLog = mergeHistory(tradesLog, data.portfolio.trades, TRADES_LIMIT);
+                        newsLog = mergeHistory(newsLog, data.news_events, NEWS_LIMIT);
+                    }
+                    historySeq = data.seq;
+                    if (data.running !== running) {
+                        running = data.running;
+                        applyUpdateMode();
+                    }
+                    data.performance_history = performanceHistory;
+                    data.price_history = priceHistory;
+                    data.portfolio.trades = tradesLog;
+                    data.news_events = newsLog;
+                    
+                    // Update status
+                    const statusDiv = refs.status;
+                    statusDiv.textContent = data.running ? 'RUNNING' : 'STOPPED';
+                    statusDiv.className = 'status ' + (data.running ? 'running' : 'stopped');
+                    
+                    // Update market sentiment
+                    updateMarketSentiment(data.market_sentiment);
+                    
+                    // Update portfolio metrics
+                    refs.totalValue.textContent = '$' + data.portfolio.total_value.toLocaleString();
+                    refs.dailyPnl.textContent = '$' + data.portfolio.daily_pnl.toLocaleString();
+                    refs.totalPnl.textContent = '$' + data.portfolio.total_pnl.toLocaleString();
+                    refs.sharpeRatio.textContent = data.portfolio.sharpe_ratio.toFixed(3);
+                    refs.maxDrawdown.textContent = (data.portfolio.max_drawdown * 100).toFixed(2) + '%';
+                    refs.winRate.textContent = (data.portfolio.win_rate * 100).toFixed(2) + '%';
+                    refs.totalTrades.textContent = data.portfolio.trades.length;
+                    refs.activePositions.textContent = Object.keys(data.portfolio.positions).length;
+                    refs.cash.textContent = '$' + data.portfolio.cash.toLocaleString();
+                    
+                    // Update asset grid
+                    updateAssetGrid(data.assets);
+                    
+                    // Update trades list
+                    updateTradesList(data.portfolio.trades);
+                    
+                    // Update news events
+                    updateNewsEvents(data.news_events);
+                    
+                    // Update charts
+                    updateCharts(data);
+                    
+                    saveCachedStatus(data);
+                }
+                
+                // The last rendered status is kept in localStorage so a reload
+                // paints immediately, before the first fetch returns
+                const CACHE_KEY = 'dash:last';
+                const CACHE_MAX_AGE = 60000;
+                const CACHE_SAVE_INTERVAL = 5000;
+                let lastCacheSave = 0;
+                
+                function saveCachedStatus(data) {
+                    const now = Date.now();
+                    if (now - lastCacheSave < CACHE_SAVE_INTERVAL) return;
+                    lastCacheSave = now;
+                    try {
+                        localStorage.setItem(CACHE_KEY, JSON.stringify({ t: now, data }));
+                    } catch (error) {
+                        // Storage full or disabled: the cache is only an optimization
+                    }
+                }
+                
+                function loadCachedStatus() {
+                    try {
+                        const cached = JSON.parse(localStorage.getItem(CACHE_KEY));
+                        if (cached && Date.now() - cached.t < CACHE_MAX_AGE) {
+                            renderStatus(cached.data);
+                        }
+                    } catch (error) {
+                        localStorage.removeItem(CACHE_KEY);
+                    }
+                }
+                
+                // Server push: /api/stream sends a status delta after every
+                // tick and resumes from Last-Event-ID when it reconnects
+                function openStream() {
+                    const url = historySeq === null ? '/api/stream' : '/api/stream?since=' + historySeq;
+                    eventSource = new EventSource(url);
+                    eventSource.onmessage = event => renderStatus(JSON.parse(event.data));
+                    eventSource.onerror = error => console.error('Status stream error:', error);
+                }
+                
+                function closeStream() {
+                    if (eventSource) {
+                        eventSource.close();
+                        eventSource = null;
+                    }
+                }
+                
+                // Long-poll fallback for browsers without EventSource: the server
+                // answers as soon as the next tick lands, so each response is
+                // immediately followed by a new wait
+                function pollLoop() {
+                    if (!polling) return;
+                    // Back off only on errors; an aborted poll is simply reissued
+                    updateDashboard(true).then(ok => setTimeout(pollLoop, ok === false ? 1000 : 0));
                 }
                 
                 function updateMarketSentiment(sentiment) {
-                    const sentimentDiv = document.getElementById('marketSentiment');
+                    const sentimentDiv = refs.marketSentiment;
                     sentimentDiv.textContent = 'Market: ' + sentiment.charAt(0).toUpperCase() + sentiment.slice(1);
                     sentimentDiv.className = 'market-sentiment sentiment-' + sentiment;
                 }
                 
-                function updateAssetGrid(assets) {
-                    const grid = document.getElementById('assetGrid');
-                    grid.innerHTML = '';
+                // Asset cards are built once per symbol and then updated in place
+                const assetCards = new Map();
+                
+                function buildAssetCard(parent, symbol, asset) {
+                    const assetDiv = document.createElement('div');
+                    assetDiv.className = 'asset-item';
+                    assetDiv.innerHTML = `
+                        <div class="asset-symbol">${symbol}</div>
+                        <div class="asset-price"></div>
+                        <div class="asset-type">${asset.type}</div>
+                        <div style="font-size: 0.8em; color: #666;">
+                            VWAP: $<span></span><br>
+                            RSI: <span></span><br>
+                            Volume: <span></span>
+                        </div>
+                    `;
+                    parent.appendChild(assetDiv);
+                    
+                    const [vwapEl, rsiEl, volumeEl] = assetDiv.querySelectorAll('span');
+                    const card = { priceEl: assetDiv.querySelector('.asset-price'), vwapEl, rsiEl, volumeEl };
+                    assetCards.set(symbol, card);
+                    return card;
+                }
+                
+                function renderAssetGrid(assets) {
+                    const grid = refs.assetGrid;
+                    const isFirstRender = assetCards.size === 0;
+                    const frag = document.createDocumentFragment();  // Cards for new symbols
                     
                     Object.entries(assets).forEach(([symbol, asset]) => {
-                        const assetDiv = document.createElement('div');
-                        assetDiv.className = 'asset-item';
+                        const card = assetCards.get(symbol) || buildAssetCard(frag, symbol, asset);
                         
                         const priceClass = asset.price > asset.vwap ? 'price-up' : 
                                          asset.price < asset.vwap ? 'price-down' : 'price-same';
                         
-                        assetDiv.innerHTML = `
-                            <div class="asset-symbol">${symbol}</div>
-                            <div class="asset-price ${priceClass}">$${asset.price.toFixed(2)}</div>
-                            <div class="asset-type">${asset.type}</div>
-                            <div style="font-size: 0.8em; color: #666;">
-                                VWAP: $${asset.vwap.toFixed(2)}<br>
-                                RSI: ${asset.rsi.toFixed(1)}<br>
-                                Volume: ${asset.volume.toLocaleString()}
-                            </div>
-                        `;
-                        
-                        grid.appendChild(assetDiv);
+                        card.priceEl.className = 'asset-price ' + priceClass;
+                        card.priceEl.textContent = '$' + asset.price.toFixed(2);
+                        card.vwapEl.textContent = asset.vwap.toFixed(2);
+                        card.rsiEl.textContent = asset.rsi.toFixed(1);
+                        card.volumeEl.textContent = asset.volume.toLocaleString();
                     });
+                    
+                    // Insert new cards in one go; the first render also drops
+                    // the loading placeholder
+                    if (isFirstRender) {
+                        grid.replaceChildren(frag);
+                    } else if (frag.childNodes.length) {
+                        grid.appendChild(frag);
+                    }
                 }
                 
+                function debounce(fn, wait) {
+                    let timer = null;
+                    return (...args) => {
+                        clearTimeout(timer);
+                        timer = setTimeout(() => fn(...args), wait);
+                    };
+                }
+                
+                // Bursts of updates collapse into one grid render (~30 Hz at most)
+                const updateAssetGrid = debounce(renderAssetGrid, 33);
+                
                 function updateTradesList(trades) {
-                    const tradesDiv = document.getElementById('tradesList');
+                    const tradesDiv = refs.tradesList;
                     
                     if (trades.length === 0) {
                         tradesDiv.innerHTML = '<div class="loading">No trades yet</div>';
                         return;
                     }
                     
-                    tradesDiv.innerHTML = '';
+                    const frag = document.createDocumentFragment();
                     const recentTrades = trades.slice(-10).reverse(); // Show last 10 trades
                     
                     recentTrades.forEach(trade => {
                         const tradeDiv = document.createElement('div');
                         tradeDiv.className = `trade-item trade-${trade.side.toLowerCase()}`;
                         
-                        const timestamp = new Date(trade.timestamp).toLocaleTimeString();
+                        const timestamp = fmtTs(trade.timestamp);
                         const pnlClass = trade.pnl > 0 ? 'price-up' : trade.pnl < 0 ? 'price-down' : 'price-same';
                         
                         tradeDiv.innerHTML = `
@@ -968,60 +1399,152 @@ class TradingDashboardHandler(http.server.SimpleHTTPRequestHandler):
                             <small>${timestamp} | Fees: $${trade.fees.toFixed(2)} | P&L: <span class="${pnlClass}">$${trade.pnl.toFixed(2)}</span></small>
                         `;
                         
-                        tradesDiv.appendChild(tradeDiv);
+                        frag.appendChild(tradeDiv);
                     });
+                    tradesDiv.replaceChildren(frag);
                 }
                 
                 function updateNewsEvents(news) {
-                    const newsDiv = document.getElementById('newsEvents');
+                    const newsDiv = refs.newsEvents;
                     
                     if (news.length === 0) {
                         newsDiv.innerHTML = '<div class="loading">Waiting for market events...</div>';
                         return;
                     }
                     
-                    newsDiv.innerHTML = '';
+                    const frag = document.createDocumentFragment();
                     news.forEach(event => {
-                        const newsDiv = document.createElement('div');
-                        newsDiv.className = `news-item news-${event.impact}`;
+                        const eventDiv = document.createElement('div');
+                        eventDiv.className = `news-item news-${event.impact}`;
                         
-                        const timestamp = new Date(event.timestamp).toLocaleTimeString();
-                        newsDiv.innerHTML = `
+                        const timestamp = fmtTs(event.timestamp);
+                        eventDiv.innerHTML = `
                             <strong>${event.event}</strong><br>
                             <small>${timestamp} | Impact: ${event.impact}</small>
                         `;
                         
-                        document.getElementById('newsEvents').appendChild(newsDiv);
+                        frag.appendChild(eventDiv);
+                    });
+                    newsDiv.replaceChildren(frag);
+                }
+                
+                // Coalesce chart redraws: at most one per chart per animation
+                // frame, drawn without Chart.js animations
+                let pendingPerf = false;
+                let pendingPrice = false;
+                
+                function schedulePerf() {
+                    if (pendingPerf) return;
+                    pendingPerf = true;
+                    requestAnimationFrame(() => {
+                        pendingPerf = false;
+                        performanceChart.update('none');
                     });
                 }
                 
+                function schedulePrice() {
+                    if (pendingPrice) return;
+                    pendingPrice = true;
+                    requestAnimationFrame(() => {
+                        pendingPrice = false;
+                        priceChart.update('none');
+                    });
+                }
+                
+                // Charts grow by the points newer than the last plotted seq and
+                // drop their oldest points past the limit, instead of being
+                // reassigned whole on every update
+                let lastPerfSeq = -1;
+                let lastPriceSeq = -1;
+                
+                function resetCharts() {
+                    lastPerfSeq = -1;
+                    lastPriceSeq = -1;
+                    [performanceChart, priceChart].forEach(chart => {
+                        chart.data.labels.length = 0;
+                        chart.data.datasets.forEach(dataset => dataset.data.length = 0);
+                    });
+                }
+                
+                function firstNewIndex(entries, lastSeq) {
+                    let i = entries.length;
+                    while (i > 0 && entries[i - 1].seq > lastSeq) i--;
+                    return i;
+                }
+                
+                function trimChart(chart, limit) {
+                    const excess = chart.data.labels.length - limit;
+                    if (excess > 0) {
+                        chart.data.labels.splice(0, excess);
+                        chart.data.datasets.forEach(dataset => dataset.data.splice(0, excess));
+                    }
+                }
+                
                 function updateCharts(data) {
                     // Update performance chart
-                    if (data.performance_history && data.performance_history.length > 0) {
-                        const labels = data.performance_history.map(p => 
-                            new Date(p.timestamp).toLocaleTimeString()
-                        );
-                        const values = data.performance_history.map(p => p.total_value);
-                        
-                        performanceChart.data.labels = labels;
-                        performanceChart.data.datasets[0].data = values;
-                        performanceChart.update();
+                    const perf = data.performance_history;
+                    if (perf && perf.length > 0 && perf[perf.length - 1].seq > lastPerfSeq) {
+                        const labels = performanceChart.data.labels;
+                        const values = performanceChart.data.datasets[0].data;
+                        for (let i = firstNewIndex(perf, lastPerfSeq); i < perf.length; i++) {
+                            labels.push(fmtTs(perf[i].timestamp));
+                            values.push(perf[i].total_value);
+                        }
+                        lastPerfSeq = perf[perf.length - 1].seq;
+                        trimChart(performanceChart, HISTORY_LIMIT);
+                        schedulePerf();
                     }
                     
                     // Update price chart
-                    if (data.price_history && data.price_history.AAPL && data.price_history.BTC) {
-                        const aaplData = data.price_history.AAPL.slice(-20);
-                        const btcData = data.price_history.BTC.slice(-20);
-                        
-                        const labels = aaplData.map(p => 
-                            new Date(p.timestamp).toLocaleTimeString()
-                        );
-                        
-                        priceChart.data.labels = labels;
-                        priceChart.data.datasets[0].data = aaplData.map(p => p.price);
-                        priceChart.data.datasets[1].data = btcData.map(p => p.price);
-                        priceChart.update();
+                    const aaplData = data.price_history && data.price_history.AAPL;
+                    const btcData = data.price_history && data.price_history.BTC;
+                    if (aaplData && btcData && aaplData.length > 0 && aaplData[aaplData.length - 1].seq > lastPriceSeq) {
+                        const [aaplSeries, btcSeries] = priceChart.data.datasets;
+                        for (let i = firstNewIndex(aaplData, lastPriceSeq); i < aaplData.length; i++) {
+                            priceChart.data.labels.push(fmtTs(aaplData[i].timestamp));
+                            aaplSeries.data.push(aaplData[i].price);
+                            btcSeries.data.push(btcData[i].price);
+                        }
+                        lastPriceSeq = aaplData[aaplData.length - 1].seq;
+                        trimChart(priceChart, PRICE_LIMIT);
+                        schedulePrice();
+                    }
+                }
+                
+                function startUpdates() {
+                    if (window.EventSource) {
+                        if (!eventSource) openStream();
+                    } else if (!polling) {
+                        polling = true;
+                        pollLoop();
+                    }
+                }
+                
+                function stopUpdates() {
+                    closeStream();
+                    polling = false;
+                }
+                
+                // A running simulator is followed over the stream (or long
+                // poll); a stopped one is only checked every few seconds, and
+                // hidden tabs make no requests at all
+                const IDLE_POLL_MS = 5000;
+                
+                function setIdleInterval(ms) {
+                    if (ms === currentIntervalMs) return;
+                    clearInterval(idleInterval);
+                    idleInterval = ms ? setInterval(updateDashboard, ms) : null;
+                    currentIntervalMs = ms;
+                }
+                
+                function applyUpdateMode() {
+                    const visible = document.visibilityState === 'visible';
+                    if (visible && running) {
+                        startUpdates();
+                    } else {
+                        stopUpdates();
                     }
+                    setIdleInterval(visible && !running ? IDLE_POLL_MS : 0);
                 }
                 
                 function startSimulator() {
@@ -1029,9 +1552,6 @@ class TradingDashboardHandler(http.server.SimpleHTTPRequestHandler):
                         .then(response => response.json())
                         .then(data => {
                             console.log('Trading simulator started');
-                            if (!updateInterval) {
-                                updateInterval = setInterval(updateDashboard, 1000);
-                            }
                             updateDashboard();
                         })
                         .catch(error => console.error('Error starting simulator:', error));
@@ -1042,10 +1562,6 @@ class TradingDashboardHandler(http.server.SimpleHTTPRequestHandler):
                         .then(response => response.json())
                         .then(data => {
                             console.log('Trading simulator stopped');
-                            if (updateInterval) {
-                                clearInterval(updateInterval);
-                                updateInterval = null;
-                            }
                             updateDashboard();
                         })
                         .catch(error => console.error('Error stopping simulator:', error));
@@ -1054,30 +1570,164 @@ class TradingDashboardHandler(http.server.SimpleHTTPRequestHandler):
                 // Initialize dashboard
                 document.addEventListener('DOMContentLoaded', function() {
                     initializeCharts();
+                    refs = Object.fromEntries([
+                        'status', 'marketSentiment', 'totalValue', 'dailyPnl', 'totalPnl',
+                        'sharpeRatio', 'maxDrawdown', 'winRate', 'totalTrades',
+                        'activePositions', 'cash', 'assetGrid', 'tradesList', 'newsEvents'
+                    ].map(id => [id, document.getElementById(id)]));
+                    loadCachedStatus();
+                    applyUpdateMode();
                     updateDashboard();
+                    
+                    // Hidden tabs pause all updates; resync once visible again
+                    document.addEventListener('visibilitychange', function() {
+                        applyUpdateMode();
+                        if (document.visibilityState === 'visible') updateDashboard();
+                    });
                 });
             </script>
         </body>
         </html>
         """
+
+_DASHBOARD_BYTES = _DASHBOARD_HTML.encode()
+_DASHBOARD_LENGTH = str(len(_DASHBOARD_BYTES))
+_DASHBOARD_ETAG = '"%s"' % hashlib.md5(_DASHBOARD_BYTES).hexdigest()
+
+
+class TradingDashboardHandler(http.server.SimpleHTTPRequestHandler):
+    """HTTP handler for the trading dashboard."""
+    
+    # Keep connections open between requests; every response but the event
+    # stream carries a Content-Length. Idle connections are dropped after
+    # KEEP_ALIVE_TIMEOUT so they don't each pin a server thread
+    protocol_version = "HTTP/1.1"
+    timeout = KEEP_ALIVE_TIMEOUT
+    
+    def setup(self):
+        """Disable Nagle's algorithm so small responses go out immediately."""
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    
+    def write_response(self, code, headers, body=b''):
+        """Write the status line, headers and body with a single send."""
+        self.log_request(code)
+        lines = [
+            '%s %d %s' % (self.protocol_version, code, self.responses[code][0]),
+            'Server: ' + self.version_string(),
+            'Date: ' + self.date_time_string()
+        ]
+        lines.extend('%s: %s' % header for header in headers)
+        lines.append('\r\n')
+        self.wfile.write('\r\n'.join(lines).encode('latin-1') + body)
+    
+    def do_GET(self):
+        """Handle GET requests."""
+        parsed_url = urlparse(self.path)
+        path = parsed_url.path
         
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        self.wfile.write(html.encode())
+        if path == "/":
+            self.send_dashboard()
+        elif path in ("/api/status", "/api/poll"):
+            query = parse_qs(parsed_url.query)
+            since = self._since(parsed_url.query)
+            if since is not None and 'wait' in query:
+                # Long poll: hold the request until the next tick
+                trading_simulator.wait_for_update(since, timeout=LONG_POLL_TIMEOUT)
+            compressed = 'gzip' in self.headers.get('Accept-Encoding', '')
+            body, etag = trading_simulator.poll_payload(since, compressed)
+            self.send_json(body, etag, 'gzip' if compressed else None)
+        elif path == "/api/stream":
+            self.send_event_stream(self._since(parsed_url.query, self.headers.get('Last-Event-ID')))
+        elif path == "/api/start":
+            trading_simulator.start()
+            self.send_api_response({"message": "Trading simulator started"})
+        elif path == "/api/stop":
+            trading_simulator.stop()
+            self.send_api_response({"message": "Trading simulator stopped"})
+        else:
+            self.send_error(404, "Not found")
+    
+    @staticmethod
+    def _since(query, default=None):
+        """Parse the ``since`` history cursor, preferring ``default`` if given."""
+        since = default or parse_qs(query).get('since', [None])[0]
+        return int(since) if since and since.isdigit() else None
+    
+    def send_event_stream(self, since):
+        """Stream a status delta to the client after every tick (Server-Sent Events).
+        
+        A stopped simulator has no more ticks to send, so the stream ends
+        after the status event that reports it stopped.
+        """
+        # The stream has no length, so it ends with the connection
+        self.close_connection = True
+        self.write_response(200, [
+            ('Content-type', 'text/event-stream'),
+            ('Cache-Control', 'no-cache'),
+            ('Connection', 'close'),
+            ('Access-Control-Allow-Origin', '*')
+        ])
+        try:
+            while True:
+                with trading_simulator.lock:  # Keep the event id and body in step
+                    seq = trading_simulator.seq
+                    running = trading_simulator.running
+                    body, _ = trading_simulator.poll_payload(since)
+                self.wfile.write(b'id: %d\ndata: %s\n\n' % (seq, body))
+                if not running:
+                    return
+                since = seq
+                while not trading_simulator.wait_for_update(since, timeout=STREAM_KEEPALIVE):
+                    # Comment line: keeps proxies from timing out, detects dead clients
+                    self.wfile.write(b': keep-alive\n\n')
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+    
+    def send_dashboard(self):
+        """Send the main dashboard HTML."""
+        if self.headers.get('If-None-Match') == _DASHBOARD_ETAG:
+            self.write_response(304, [('ETag', _DASHBOARD_ETAG), ('Cache-Control', 'public, max-age=60')])
+            return
+        
+        self.write_response(200, [
+            ('Content-type', 'text/html'),
+            ('Content-Length', _DASHBOARD_LENGTH),
+            ('ETag', _DASHBOARD_ETAG),
+            ('Cache-Control', 'public, max-age=60')
+        ], _DASHBOARD_BYTES)
     
     def send_api_response(self, data):
         """Send JSON API response."""
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.send_json(_dumps(data))
+    
+    def send_json(self, body, etag=None, encoding=None):
+        """Send an already serialized (and possibly ``encoding``-compressed) JSON body.
+        
+        With an ``etag``, a client whose If-None-Match already names this
+        payload gets a bodyless 304, and the response asks to be revalidated.
+        Responses without one are never stored.
+        """
+        headers = [('Access-Control-Allow-Origin', '*')]
+        if encoding is not None:
+            headers += [('Content-Encoding', encoding), ('Vary', 'Accept-Encoding')]
+        if etag is None:
+            headers.append(('Cache-Control', 'no-store'))
+        else:
+            headers += [('ETag', etag), ('Cache-Control', 'no-cache')]
+            if self.headers.get('If-None-Match') == etag:
+                self.write_response(304, headers)
+                return
+        
+        self.write_response(200, [
+            ('Content-type', 'application/json; charset=utf-8'),
+            ('Content-Length', len(body))
+        ] + headers, body)
 
 
 def start_trading_dashboard(port=8001):
     """Start the trading dashboard."""
-    with socketserver.TCPServer(("", port), TradingDashboardHandler) as httpd:
+    with http.server.ThreadingHTTPServer(("", port), TradingDashboardHandler) as httpd:
         print(f"🚀 AI Trading Dashboard started at http://localhost:{port}")
         print("📊 Multi-Asset Trading Simulator with Real-Time Data")
         print("🎯 Features: VWAP + RSI Strategies, Risk Management, Live Charts")
@@ -1087,6 +1737,11 @@ def start_trading_dashboard(port=8001):
         def update_simulator():
             while True:
                 trading_simulator.update_market_data()
+                
+                # Serialize the full snapshot and the one-tick delta that
+                # up-to-date clients ask for, once, ahead of the readers
+                trading_simulator.poll_payload()
+                trading_simulator.poll_payload(trading_simulator.seq - 1)
                 time.sleep(1)
         
         update_thread = threading.Thread(target=update_simulator, daemon=True)
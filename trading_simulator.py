@@ -8,12 +8,84 @@ import time
 import random
 import math
 import json
+import sys
 import threading
+from array import array
+from collections import deque
+from itertools import islice
+from operator import mul, sub, truediv
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
-from enum import Enum
-import statistics
+from enum import Enum, IntEnum
+
+from simple_demo import _wait_for_deadline
+
+
+# Indicator values each strategy keeps for inspection, most recent last:
+# at least this many, and fewer than twice as many
+SCORE_HISTORY = 1000
+
+# Window shared by each asset's VWAP and mean reversion strategies
+STRATEGY_WINDOW = 20
+
+# Steps of per-step performance records kept, on the same terms
+PERFORMANCE_HISTORY = 100000
+
+# Most recent trades kept in ``trades``, on the same terms
+TRADE_HISTORY = 100000
+
+# Simulated time covered by one simulation step
+SIM_STEP = timedelta(seconds=1)
+
+# Wall-clock seconds between status lines in run_advanced_simulation
+STATUS_INTERVAL = 5.0
+
+# Trade sides and strategy names recur in every Trade; interned, each
+# record points at one shared string
+BUY = sys.intern("BUY")
+SELL = sys.intern("SELL")
+COMBINED = sys.intern("combined")
+
+
+def _check_history_typecode(typecode: str):
+    """Raise ValueError unless ``typecode`` is a float array typecode."""
+    if typecode not in ('d', 'f'):
+        raise ValueError(f"history_typecode must be 'd' or 'f', not {typecode!r}")
+
+
+def _trim(keep: int, *histories):
+    """Cut histories back to their last ``keep`` values."""
+    for history in histories:
+        del history[:-keep]
+
+
+def _bollinger(prices: List[float], period: int, k: float) -> Tuple[float, float, float]:
+    """Return the (upper, middle, lower) bands over the last ``period`` prices."""
+    recent = prices[-period:]
+    sma = sum(recent) / period
+    deviations = [p - sma for p in recent]
+    band = k * math.sqrt(sum(map(mul, deviations, deviations)) / period)
+    return sma + band, sma, sma - band
+
+
+def _rsi(prices: List[float], period: int) -> float:
+    """Return the RSI of the last ``period`` price changes in a single pass."""
+    gain = loss = 0.0
+    prev = prices[-period - 1]
+    for price in islice(prices, len(prices) - period, None):
+        change = price - prev
+        if change > 0:
+            gain += change
+        else:
+            loss -= change
+        prev = price
+    
+    if loss == 0:
+        return 100.0
+    
+    rs = (gain / period) / (loss / period)
+    return 100 - (100 / (1 + rs))
 
 
 class AssetType(Enum):
@@ -23,6 +95,13 @@ class AssetType(Enum):
     COMMODITY = "commodity"
 
 
+class Signal(IntEnum):
+    """Trading signal codes; opposite signals sum to HOLD."""
+    SELL = -1
+    HOLD = 0
+    BUY = 1
+
+
 class StrategyType(Enum):
     VWAP_MOMENTUM = "vwap_momentum"
     MEAN_REVERSION = "mean_reversion"
@@ -31,7 +110,7 @@ class StrategyType(Enum):
     AI_ML = "ai_ml"
 
 
-@dataclass
+@dataclass(slots=True)
 class Asset:
     symbol: str
     name: str
@@ -43,7 +122,7 @@ class Asset:
     timezone_offset: int
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketData:
     symbol: str
     price: float
@@ -57,7 +136,7 @@ class MarketData:
     spread: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     id: str
     symbol: str
@@ -70,7 +149,7 @@ class Trade:
     fees: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Portfolio:
     cash: float
     positions: Dict[str, int]
@@ -82,43 +161,90 @@ class Portfolio:
     win_rate: float
 
 
+class SymbolState:
+    """Rolling price and volume samples for one symbol, shared by its strategies.
+    
+    The buffer keeps one sample more than the longest strategy window, so
+    each strategy can still read the sample that just left its window.
+    """
+    __slots__ = ('window', 'prices', 'volumes')
+    
+    def __init__(self, window: int):
+        self.window = window
+        # A full deque evicts its oldest sample in O(1)
+        self.prices = deque(maxlen=window + 1)
+        self.volumes = deque(maxlen=window + 1)
+    
+    def check_window(self, period: int):
+        """Raise ValueError unless the buffer is long enough for ``period``."""
+        if period > self.window:
+            raise ValueError(f"strategy window {period} exceeds the shared state window {self.window}")
+    
+    def update(self, price: float, volume: int = 0):
+        """Append this tick's sample."""
+        self.prices.append(price)
+        self.volumes.append(volume)
+
+
 class AdvancedVWAPStrategy:
-    """Advanced VWAP strategy with momentum and mean reversion."""
+    """Advanced VWAP strategy with momentum and mean reversion.
     
-    def __init__(self, symbol: str, lookback_period: int = 20):
+    With a shared ``state`` the owner updates it once per tick before
+    calling generate_signal; otherwise the strategy keeps its own.
+    ``history_typecode`` 'f' stores the indicator histories as FP32.
+    """
+    
+    def __init__(self, symbol: str, lookback_period: int = 20, state: Optional[SymbolState] = None,
+                 history_typecode: str = 'd'):
         self.symbol = symbol
         self.lookback_period = lookback_period
-        self.price_history = []
-        self.volume_history = []
-        self.vwap_values = []
-        self.momentum_scores = []
-        self.volatility_scores = []
+        self.owns_state = state is None
+        self.state = SymbolState(lookback_period) if state is None else state
+        self.state.check_window(lookback_period)
+        # Indicator histories as unboxed doubles (or floats), appended in
+        # step and trimmed in chunks once they reach twice SCORE_HISTORY
+        _check_history_typecode(history_typecode)
+        self.vwap_values = array(history_typecode)
+        self.momentum_scores = array(history_typecode)
+        self.volatility_scores = array(history_typecode)
         self.signal_strength = 0.0
         
+        # Running sums over the window, updated as samples enter and leave:
+        # price*volume and volume (VWAP), price and index*price (momentum
+        # regression), and one-tick returns and their squares (volatility).
+        # They stay Python floats (FP64) whatever the history typecode, so
+        # the variance doesn't lose precision to cancellation. They are
+        # rebuilt from the window once per full turnover, so rounding left
+        # behind by evicted samples can't accumulate
+        self.sum_pv = 0.0
+        self.sum_v = 0
+        self.sum_p = 0.0
+        self.sum_ip = 0.0
+        self.sum_r = 0.0
+        self.sum_r2 = 0.0
+        self.evictions = 0
+        
     def calculate_vwap(self, prices: List[float], volumes: List[int]) -> float:
         """Calculate Volume Weighted Average Price."""
         if not prices or not volumes:
             return 0.0
         
-        total_pv = sum(p * v for p, v in zip(prices, volumes))
         total_volume = sum(volumes)
         
-        return total_pv / total_volume if total_volume > 0 else 0.0
+        return sum(map(mul, prices, volumes)) / total_volume if total_volume > 0 else 0.0
     
     def calculate_momentum(self, prices: List[float]) -> float:
         """Calculate price momentum using linear regression."""
-        if len(prices) < 5:
+        n = len(prices)
+        if n < 5:
             return 0.0
         
-        x = list(range(len(prices)))
-        y = prices
-        
-        # Simple linear regression
-        n = len(x)
-        sum_x = sum(x)
-        sum_y = sum(y)
-        sum_xy = sum(x[i] * y[i] for i in range(n))
-        sum_x2 = sum(x[i] ** 2 for i in range(n))
+        # Simple linear regression against x = 0..n-1, whose sums have
+        # closed forms; only the price sums need a pass over the data
+        sum_x = n * (n - 1) // 2
+        sum_x2 = (n - 1) * n * (2 * n - 1) // 6
+        sum_y = sum(prices)
+        sum_xy = sum(map(mul, range(n), prices))
         
         slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x ** 2)
         return slope
@@ -128,33 +254,98 @@ class AdvancedVWAPStrategy:
         if len(prices) < 2:
             return 0.0
         
-        returns = [(prices[i] - prices[i-1]) / prices[i-1] for i in range(1, len(prices))]
-        return statistics.stdev(returns) if len(returns) > 1 else 0.0
+        returns = list(map(truediv, map(sub, prices[1:], prices), prices))
+        n = len(returns)
+        if n < 2:
+            return 0.0
+        
+        # Sample standard deviation in floats; statistics.stdev computes
+        # exactly with fractions, which costs far more than it adds here
+        mean = sum(returns) / n
+        return math.sqrt(sum((r - mean) ** 2 for r in returns) / (n - 1))
+    
+    @property
+    def price_history(self) -> List[float]:
+        """Prices in the strategy window, oldest first."""
+        return list(self.state.prices)[-self.lookback_period:]
     
-    def generate_signal(self, current_price: float, current_volume: int) -> Tuple[str, float]:
+    @property
+    def volume_history(self) -> List[int]:
+        """Volumes in the strategy window, oldest first."""
+        return list(self.state.volumes)[-self.lookback_period:]
+    
+    def _resync_sums(self):
+        """Recompute the running window sums exactly from the window."""
+        prices = self.price_history
+        volumes = self.volume_history
+        returns = list(map(truediv, map(sub, prices[1:], prices), prices))
+        self.sum_pv = sum(map(mul, prices, volumes))
+        self.sum_v = sum(volumes)
+        self.sum_p = sum(prices)
+        self.sum_ip = sum(map(mul, range(len(prices)), prices))
+        self.sum_r = sum(returns)
+        self.sum_r2 = sum(map(mul, returns, returns))
+        self.evictions = 0
+    
+    def generate_signal(self, current_price: float, current_volume: int) -> Tuple[Signal, float]:
         """Generate advanced trading signal with confidence score."""
-        self.price_history.append(current_price)
-        self.volume_history.append(current_volume)
+        state = self.state
+        if self.owns_state:
+            state.update(current_price, current_volume)
+        prices = state.prices
+        volumes = state.volumes
+        lookback = self.lookback_period
+        
+        # Evict the sample that just left the window from the sums; every
+        # remaining price moves down one regression index, which lowers
+        # sum_ip by their sum
+        n = len(prices)
+        if n > lookback:
+            old_price = prices[-lookback - 1]
+            old_volume = volumes[-lookback - 1]
+            self.sum_pv -= old_price * old_volume
+            self.sum_v -= old_volume
+            self.sum_p -= old_price
+            self.sum_ip -= self.sum_p
+            if lookback > 1:
+                old_return = (prices[-lookback] - old_price) / old_price
+                self.sum_r -= old_return
+                self.sum_r2 -= old_return * old_return
+            self.evictions += 1
+            n = lookback
         
-        # Keep only recent data
-        if len(self.price_history) > self.lookback_period:
-            self.price_history.pop(0)
-            self.volume_history.pop(0)
+        if n > 1:
+            last_price = prices[-2]
+            ret = (current_price - last_price) / last_price
+            self.sum_r += ret
+            self.sum_r2 += ret * ret
+        self.sum_pv += current_price * current_volume
+        self.sum_v += current_volume
+        self.sum_p += current_price
+        self.sum_ip += (n - 1) * current_price
+        if self.evictions >= n:
+            self._resync_sums()
         
-        if len(self.price_history) < 5:
-            return "HOLD", 0.0
+        if n < 5:
+            return Signal.HOLD, 0.0
         
         # Calculate VWAP
-        vwap = self.calculate_vwap(self.price_history, self.volume_history)
+        vwap = self.sum_pv / self.sum_v if self.sum_v > 0 else 0.0
         self.vwap_values.append(vwap)
         
-        # Calculate momentum
-        momentum = self.calculate_momentum(self.price_history)
+        # Calculate momentum: regression slope against x = 0..n-1
+        sum_x = n * (n - 1) // 2
+        sum_x2 = (n - 1) * n * (2 * n - 1) // 6
+        momentum = (n * self.sum_ip - sum_x * self.sum_p) / (n * sum_x2 - sum_x ** 2)
         self.momentum_scores.append(momentum)
         
-        # Calculate volatility
-        volatility = self.calculate_volatility(self.price_history)
+        # Calculate volatility: sample stdev of the n - 1 returns
+        m = n - 1
+        variance = (self.sum_r2 - self.sum_r * self.sum_r / m) / (m - 1)
+        volatility = math.sqrt(variance) if variance > 0 else 0.0
         self.volatility_scores.append(volatility)
+        if len(self.volatility_scores) >= 2 * SCORE_HISTORY:
+            _trim(SCORE_HISTORY, self.vwap_values, self.momentum_scores, self.volatility_scores)
         
         # Signal generation logic
         price_deviation = (current_price - vwap) / vwap if vwap > 0 else 0
@@ -170,83 +361,113 @@ class AdvancedVWAPStrategy:
         
         # Generate signal
         if signal_strength < -0.02:
-            return "BUY", abs(signal_strength)
+            return Signal.BUY, abs(signal_strength)
         elif signal_strength > 0.02:
-            return "SELL", abs(signal_strength)
+            return Signal.SELL, abs(signal_strength)
         else:
-            return "HOLD", abs(signal_strength)
+            return Signal.HOLD, abs(signal_strength)
 
 
 class MeanReversionStrategy:
     """Mean reversion strategy using Bollinger Bands and RSI."""
     
-    def __init__(self, symbol: str, period: int = 20, std_dev: float = 2.0):
+    def __init__(self, symbol: str, period: int = 20, std_dev: float = 2.0, rsi_period: int = 14,
+                 state: Optional[SymbolState] = None, history_typecode: str = 'd'):
         self.symbol = symbol
         self.period = period
         self.std_dev = std_dev
-        self.price_history = []
-        self.rsi_values = []
+        self.rsi_period = rsi_period
+        self.owns_state = state is None
+        self.state = SymbolState(period) if state is None else state
+        self.state.check_window(period)
+        _check_history_typecode(history_typecode)
+        self.rsi_values = array(history_typecode)
         
+        # Running sum and sum of squares of the last `period` prices for
+        # the bands, rebuilt once per full turnover like the VWAP sums, and
+        # Wilder-smoothed average gain/loss for the RSI, seeded with the
+        # simple average of the first rsi_period changes
+        self.sum_p = 0.0
+        self.sum_p2 = 0.0
+        self.evictions = 0
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.changes = 0
+        
+    @property
+    def price_history(self) -> List[float]:
+        """Prices in the band window, oldest first."""
+        return list(self.state.prices)[-self.period:]
+    
     def calculate_bollinger_bands(self, prices: List[float]) -> Tuple[float, float, float]:
         """Calculate Bollinger Bands."""
         if len(prices) < self.period:
             return 0.0, 0.0, 0.0
         
-        recent_prices = prices[-self.period:]
-        sma = sum(recent_prices) / len(recent_prices)
-        
-        variance = sum((p - sma) ** 2 for p in recent_prices) / len(recent_prices)
-        std = math.sqrt(variance)
-        
-        upper_band = sma + (self.std_dev * std)
-        lower_band = sma - (self.std_dev * std)
-        
-        return upper_band, sma, lower_band
+        return _bollinger(prices, self.period, self.std_dev)
     
     def calculate_rsi(self, prices: List[float], period: int = 14) -> float:
         """Calculate Relative Strength Index."""
         if len(prices) < period + 1:
             return 50.0
         
-        gains = []
-        losses = []
-        
-        for i in range(1, len(prices)):
-            change = prices[i] - prices[i-1]
-            if change > 0:
-                gains.append(change)
-                losses.append(0)
-            else:
-                gains.append(0)
-                losses.append(abs(change))
-        
-        avg_gain = sum(gains[-period:]) / period
-        avg_loss = sum(losses[-period:]) / period
-        
-        if avg_loss == 0:
-            return 100.0
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return rsi
+        return _rsi(prices, period)
     
-    def generate_signal(self, current_price: float) -> Tuple[str, float]:
+    def generate_signal(self, current_price: float) -> Tuple[Signal, float]:
         """Generate mean reversion signal."""
-        self.price_history.append(current_price)
+        state = self.state
+        if self.owns_state:
+            state.update(current_price)
+        prices = state.prices
+        period = self.period
+        n = len(prices)
+        
+        if n > 1:
+            change = current_price - prices[-2]
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            rsi_period = self.rsi_period
+            if self.changes < rsi_period:
+                self.avg_gain += gain / rsi_period
+                self.avg_loss += loss / rsi_period
+            else:
+                self.avg_gain = (self.avg_gain * (rsi_period - 1) + gain) / rsi_period
+                self.avg_loss = (self.avg_loss * (rsi_period - 1) + loss) / rsi_period
+            self.changes += 1
         
-        if len(self.price_history) > self.period * 2:
-            self.price_history.pop(0)
+        if n > period:
+            leaving = prices[-period - 1]
+            self.sum_p -= leaving
+            self.sum_p2 -= leaving * leaving
+            self.evictions += 1
+        self.sum_p += current_price
+        self.sum_p2 += current_price * current_price
+        if self.evictions >= period:
+            recent = self.price_history
+            self.sum_p = sum(recent)
+            self.sum_p2 = sum(map(mul, recent, recent))
+            self.evictions = 0
         
-        if len(self.price_history) < self.period:
-            return "HOLD", 0.0
+        if n < period:
+            return Signal.HOLD, 0.0
         
         # Calculate Bollinger Bands
-        upper, middle, lower = self.calculate_bollinger_bands(self.price_history)
+        middle = self.sum_p / period
+        variance = self.sum_p2 / period - middle * middle
+        band = self.std_dev * math.sqrt(variance) if variance > 0 else 0.0
+        upper = middle + band
+        lower = middle - band
         
         # Calculate RSI
-        rsi = self.calculate_rsi(self.price_history)
+        if self.changes < self.rsi_period:
+            rsi = 50.0
+        elif self.avg_loss == 0:
+            rsi = 100.0
+        else:
+            rsi = 100 - (100 / (1 + self.avg_gain / self.avg_loss))
         self.rsi_values.append(rsi)
+        if len(self.rsi_values) >= 2 * SCORE_HISTORY:
+            _trim(SCORE_HISTORY, self.rsi_values)
         
         # Signal generation
         price_position = (current_price - lower) / (upper - lower) if upper != lower else 0.5
@@ -254,14 +475,30 @@ class MeanReversionStrategy:
         # Oversold condition (buy signal)
         if current_price < lower and rsi < 30:
             confidence = min(1.0, (lower - current_price) / lower * 2)
-            return "BUY", confidence
+            return Signal.BUY, confidence
         
         # Overbought condition (sell signal)
         elif current_price > upper and rsi > 70:
             confidence = min(1.0, (current_price - upper) / upper * 2)
-            return "SELL", confidence
+            return Signal.SELL, confidence
         
-        return "HOLD", 0.0
+        return Signal.HOLD, 0.0
+
+
+def combine_signals(vwap_signals: List[int], mr_signals: List[int],
+                    vwap_confidences: List[float], mr_confidences: List[float]) -> Tuple[List[int], List[float]]:
+    """Combine both strategies' per-asset signals into one signal and confidence each.
+    
+    Agreeing signals keep their code with the average confidence. Otherwise
+    the codes are summed: a lone signal wins over HOLD, and opposite signals
+    cancel to HOLD. Any non-HOLD result then takes the higher confidence.
+    """
+    signals = [v if v == m else v + m for v, m in zip(vwap_signals, mr_signals)]
+    confidences = [
+        (vc + mc) / 2 if v == m and v else max(vc, mc)
+        for v, m, vc, mc in zip(vwap_signals, mr_signals, vwap_confidences, mr_confidences)
+    ]
+    return signals, confidences
 
 
 class RiskManager:
@@ -285,21 +522,30 @@ class RiskManager:
         """Check if daily loss limit is exceeded."""
         return new_pnl >= -self.max_daily_loss
     
-    def check_correlation_risk(self, new_symbol: str, existing_positions: Dict[str, int], 
-                              correlation_matrix: Dict[str, Dict[str, float]]) -> bool:
-        """Check correlation risk with existing positions."""
-        for symbol in existing_positions:
-            if existing_positions[symbol] != 0:
-                correlation = correlation_matrix.get(new_symbol, {}).get(symbol, 0)
-                if abs(correlation) > self.correlation_threshold:
-                    return False
-        return True
+    def check_correlation_risk(self, new_idx: int, held_mask: List[bool],
+                              correlation_matrix: List[List[float]]) -> bool:
+        """Check correlation risk with existing positions.
+        
+        ``correlation_matrix`` is the dense matrix indexed by asset id and
+        ``held_mask`` flags the asset ids with an open position.
+        """
+        threshold = self.correlation_threshold
+        return not any(
+            held and abs(correlation) > threshold
+            for correlation, held in zip(correlation_matrix[new_idx], held_mask)
+        )
 
 
 class AdvancedTradingSimulator:
     """Advanced multi-asset trading simulator."""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None, history_typecode: str = 'd'):
+        # Dedicated generator so a seed makes a run reproducible
+        self._rng = random.Random(seed)
+        # 'f' keeps the strategies' indicator histories as FP32, halving
+        # their memory; the running sums behind them stay FP64
+        _check_history_typecode(history_typecode)
+        self.history_typecode = history_typecode
         self.assets = self._initialize_assets()
         self.strategies = {}
         self.risk_manager = RiskManager()
@@ -313,17 +559,83 @@ class AdvancedTradingSimulator:
             max_drawdown=0.0,
             win_rate=0.0
         )
+        # Recent trades, trimmed back to TRADE_HISTORY once they reach twice
+        # that; _trade_count counts every trade ever executed
         self.trades = []
+        self._trade_count = 0
         self.market_data = {}
         self.running = False
-        self.performance_metrics = []
+        # Per-step performance record as parallel double arrays (epoch
+        # timestamp, total value, cash, daily P&L) rather than a dict per
+        # step, bounded by PERFORMANCE_HISTORY; performance_records() and
+        # the performance_metrics property build dicts on demand
+        self._pm_times = array('d')
+        self._pm_values = array('d')
+        self._pm_cash = array('d')
+        self._pm_pnl = array('d')
+        # Running performance state: Welford mean/M2 of per-step returns,
+        # the value peak and the count of winning steps
+        self._n_returns = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._peak = 0.0
+        self._wins = 0
+        
+        # Per-asset columns indexed by a stable asset id: the live base
+        # prices are kept here and copied back into self.assets on demand
+        self._symbols = list(self.assets)
+        self._index = {symbol: i for i, symbol in enumerate(self._symbols)}
+        self._base_prices = [asset.base_price for asset in self.assets.values()]
+        self._volatilities = [asset.volatility for asset in self.assets.values()]
+        self._asset_types = [asset.asset_type for asset in self.assets.values()]
+        self._market_open = [asset.market_hours[0] for asset in self.assets.values()]
+        self._market_close = [asset.market_hours[1] for asset in self.assets.values()]
+        
+        # Per-asset constants that depend only on the asset type, resolved
+        # once so the step never branches on it
+        self._is_stock = [asset_type == AssetType.STOCK for asset_type in self._asset_types]
+        self._base_volumes = [1000000 if stock else 100000 for stock in self._is_stock]
+        self._spread_pcts = [0.001 if stock else 0.01 for stock in self._is_stock]
+        
+        # Per-asset price shock scale (volatility with the market-hours
+        # factor, as a per-step fraction) by hour of day, filled on first use
+        self._step_sigmas = {}
+        
+        # Held quantity and last traded price per asset id, so the portfolio
+        # is valued with one pass over the columns; portfolio.positions is
+        # kept in step for reporting
+        self._positions = [0] * len(self._symbols)
+        self._last_prices = [0.0] * len(self._symbols)
+        self._held_mask = [False] * len(self._symbols)
+        
+        # Dense symmetric correlation matrix by asset id; pairs no asset
+        # lists, and assets outside the universe, count as uncorrelated
+        self._correlations = [[0.0] * len(self._symbols) for _ in self._symbols]
+        for i, asset in enumerate(self.assets.values()):
+            for other, correlation in asset.correlation_matrix.items():
+                j = self._index.get(other)
+                if j is not None:
+                    self._correlations[i][j] = self._correlations[j][i] = correlation
         
-        # Initialize strategies for each asset
+        # Initialize strategies for each asset, sharing one rolling price
+        # and volume buffer per asset that the step updates once per tick
+        self._symbol_states = []
         for asset in self.assets.values():
+            state = SymbolState(STRATEGY_WINDOW)
+            self._symbol_states.append(state)
             self.strategies[asset.symbol] = {
-                'vwap': AdvancedVWAPStrategy(asset.symbol),
-                'mean_reversion': MeanReversionStrategy(asset.symbol)
+                'vwap': AdvancedVWAPStrategy(asset.symbol, STRATEGY_WINDOW, state=state,
+                                             history_typecode=history_typecode),
+                'mean_reversion': MeanReversionStrategy(asset.symbol, STRATEGY_WINDOW, state=state,
+                                                        history_typecode=history_typecode)
             }
+        
+        # Each asset's strategy signal methods by asset id, bound once so the
+        # step loop skips the nested dict lookups
+        self._signal_generators = [
+            (self.strategies[symbol]['vwap'].generate_signal, self.strategies[symbol]['mean_reversion'].generate_signal)
+            for symbol in self._symbols
+        ]
     
     def _initialize_assets(self) -> Dict[str, Asset]:
         """Initialize diverse asset universe."""
@@ -350,41 +662,32 @@ class AdvancedTradingSimulator:
                            {'GOLD': 0.7, 'AAPL': -0.1, 'MSFT': -0.1}, (0, 24), -5)
         }
     
-    def generate_market_data(self, symbol: str) -> MarketData:
-        """Generate realistic market data for an asset."""
-        asset = self.assets[symbol]
-        
-        # Simulate realistic price movements
-        volatility = asset.volatility
-        time_factor = 1.0
-        
-        # Market hours adjustment
-        current_hour = datetime.now().hour
-        if asset.asset_type == AssetType.STOCK:
-            if current_hour < asset.market_hours[0] or current_hour > asset.market_hours[1]:
-                time_factor = 0.1  # Reduced volatility outside market hours
+    def generate_market_data(self, symbol: str, now: Optional[datetime] = None) -> MarketData:
+        """Generate realistic market data for an asset, stamped ``now`` (default: the current time)."""
+        if now is None:
+            now = datetime.now()
+        i = self._index[symbol]
         
         # Price movement
-        price_change = random.gauss(0, volatility * time_factor * 0.01)
-        new_price = asset.base_price * (1 + price_change)
+        price_change = self._rng.gauss(0, self._sigmas_at(now.hour)[i])
+        new_price = self._base_prices[i] * (1 + price_change)
         
         # Volume simulation
-        base_volume = 1000000 if asset.asset_type == AssetType.STOCK else 100000
-        volume_change = random.uniform(-0.3, 0.3)
+        base_volume = self._base_volumes[i]
+        volume_change = self._rng.uniform(-0.3, 0.3)
         new_volume = int(base_volume * (1 + volume_change))
         
         # High/Low simulation
-        high = new_price * random.uniform(1.0, 1.02)
-        low = new_price * random.uniform(0.98, 1.0)
+        high = new_price * self._rng.uniform(1.0, 1.02)
+        low = new_price * self._rng.uniform(0.98, 1.0)
         
         # Bid/Ask spread
-        spread_pct = 0.001 if asset.asset_type == AssetType.STOCK else 0.01
-        spread = new_price * spread_pct
+        spread = new_price * self._spread_pcts[i]
         bid = new_price - spread / 2
         ask = new_price + spread / 2
         
         # Update base price for next iteration
-        asset.base_price = new_price
+        self._base_prices[i] = new_price
         
         return MarketData(
             symbol=symbol,
@@ -392,15 +695,73 @@ class AdvancedTradingSimulator:
             volume=new_volume,
             high=high,
             low=low,
-            open_price=asset.base_price,
-            timestamp=datetime.now(),
+            open_price=new_price,
+            timestamp=now,
             bid=bid,
             ask=ask,
             spread=spread
         )
     
-    def execute_trade(self, symbol: str, side: str, quantity: int, price: float, strategy: str) -> bool:
-        """Execute a trade with risk management."""
+    def _sigmas_at(self, hour: int) -> List[float]:
+        """Return each asset's price shock scale at ``hour``, computed once per hour."""
+        sigmas = self._step_sigmas.get(hour)
+        if sigmas is None:
+            # Reduced volatility for stocks outside market hours
+            sigmas = self._step_sigmas[hour] = [
+                volatility * (0.1 if stock and (hour < open_hour or hour > close_hour) else 1.0) * 0.01
+                for volatility, stock, open_hour, close_hour in zip(
+                    self._volatilities, self._is_stock, self._market_open, self._market_close
+                )
+            ]
+        return sigmas
+    
+    def _batch_generate_market_data(self, now: datetime) -> Dict[str, MarketData]:
+        """Generate market data for every asset at once, stamped ``now``.
+        
+        Each random quantity is drawn as one column across all assets, with
+        uniforms taken straight from ``random()`` and scaled as ``uniform()``
+        would, so the per-asset loop below only does arithmetic.
+        """
+        rng = self._rng
+        draw = rng.random
+        gauss = rng.gauss
+        n = len(self._symbols)
+        shocks = [gauss(0.0, 1.0) for _ in range(n)]
+        volume_draws = [draw() for _ in range(n)]
+        high_draws = [draw() for _ in range(n)]
+        low_draws = [draw() for _ in range(n)]
+        
+        # Step every base price in one pass over the columns
+        self._base_prices = new_prices = [
+            price * (1 + shock * sigma)
+            for price, shock, sigma in zip(self._base_prices, shocks, self._sigmas_at(now.hour))
+        ]
+        
+        market_data = {}
+        for symbol, new_price, base_volume, spread_pct, u_volume, u_high, u_low in zip(
+            self._symbols, new_prices, self._base_volumes, self._spread_pcts, volume_draws, high_draws, low_draws
+        ):
+            new_volume = int(base_volume * (1 + (-0.3 + 0.6 * u_volume)))
+            spread = new_price * spread_pct
+            
+            market_data[symbol] = MarketData(
+                symbol=symbol,
+                price=new_price,
+                volume=new_volume,
+                high=new_price * (1.0 + 0.02 * u_high),
+                low=new_price * (0.98 + 0.02 * u_low),
+                open_price=new_price,
+                timestamp=now,
+                bid=new_price - spread / 2,
+                ask=new_price + spread / 2,
+                spread=spread
+            )
+        
+        return market_data
+    
+    def execute_trade(self, symbol: str, side: str, quantity: int, price: float, strategy: str,
+                      now: Optional[datetime] = None) -> bool:
+        """Execute a trade with risk management, stamped ``now`` (default: the current time)."""
         # Risk checks
         if not self.risk_manager.check_position_limit(symbol, quantity, price, self.portfolio.total_value):
             return False
@@ -409,141 +770,157 @@ class AdvancedTradingSimulator:
         trade_value = quantity * price
         fees = trade_value * 0.001  # 0.1% commission
         
-        if side == "BUY":
+        i = self._index[symbol]
+        if side == BUY:
             if self.portfolio.cash < (trade_value + fees):
                 return False
             
             self.portfolio.cash -= (trade_value + fees)
-            self.portfolio.positions[symbol] = self.portfolio.positions.get(symbol, 0) + quantity
+            self._positions[i] += quantity
         else:  # SELL
-            if self.portfolio.positions.get(symbol, 0) < quantity:
+            if self._positions[i] < quantity:
                 return False
             
             self.portfolio.cash += (trade_value - fees)
-            self.portfolio.positions[symbol] = self.portfolio.positions.get(symbol, 0) - quantity
+            self._positions[i] -= quantity
+        self.portfolio.positions[symbol] = self._positions[i]
+        self._held_mask[i] = self._positions[i] != 0
         
         # Record trade
+        self._trade_count += 1
         trade = Trade(
-            id=f"T{len(self.trades)+1:06d}",
+            id='T%06d' % self._trade_count,
             symbol=symbol,
-            side=side,
+            side=BUY if side == BUY else SELL,
             quantity=quantity,
             price=price,
-            timestamp=datetime.now(),
-            strategy=strategy,
+            timestamp=now if now is not None else datetime.now(),
+            strategy=sys.intern(strategy),
             pnl=0.0,
             fees=fees
         )
         self.trades.append(trade)
+        if len(self.trades) >= 2 * TRADE_HISTORY:
+            _trim(TRADE_HISTORY, self.trades)
         
         return True
     
-    def update_portfolio_value(self):
-        """Update portfolio value and calculate metrics."""
-        total_value = self.portfolio.cash
-        
-        for symbol, quantity in self.portfolio.positions.items():
-            if quantity != 0 and symbol in self.market_data:
-                price = self.market_data[symbol].price
-                total_value += quantity * price
-        
+    def update_portfolio_value(self, now: Optional[datetime] = None):
+        """Update portfolio value and calculate metrics, recorded at ``now`` (default: the current time)."""
+        total_value = self.portfolio.cash + sum(map(mul, self._positions, self._last_prices))
         self.portfolio.total_value = total_value
         
         # Calculate daily P&L
-        if self.performance_metrics:
-            last_value = self.performance_metrics[-1]['total_value']
+        if self._pm_values:
+            last_value = self._pm_values[-1]
             self.portfolio.daily_pnl = total_value - last_value
+            self._calculate_advanced_metrics(last_value, total_value)
         else:
             self.portfolio.daily_pnl = 0.0
+            self._peak = total_value
         
         # Update performance metrics
-        self.performance_metrics.append({
-            'timestamp': datetime.now(),
-            'total_value': total_value,
-            'cash': self.portfolio.cash,
-            'daily_pnl': self.portfolio.daily_pnl
-        })
-        
-        # Calculate advanced metrics
-        self._calculate_advanced_metrics()
-    
-    def _calculate_advanced_metrics(self):
-        """Calculate advanced performance metrics."""
-        if len(self.performance_metrics) < 2:
-            return
+        self._pm_times.append(now.timestamp() if now is not None else time.time())
+        self._pm_values.append(total_value)
+        self._pm_cash.append(self.portfolio.cash)
+        self._pm_pnl.append(self.portfolio.daily_pnl)
+        if len(self._pm_values) >= 2 * PERFORMANCE_HISTORY:
+            _trim(PERFORMANCE_HISTORY, self._pm_times, self._pm_values, self._pm_cash, self._pm_pnl)
+    
+    def performance_records(self, last: Optional[int] = None) -> List[dict]:
+        """Build per-step performance records, oldest first, from the arrays.
         
-        # Calculate returns
-        returns = []
-        for i in range(1, len(self.performance_metrics)):
-            prev_value = self.performance_metrics[i-1]['total_value']
-            curr_value = self.performance_metrics[i]['total_value']
-            if prev_value > 0:
-                returns.append((curr_value - prev_value) / prev_value)
+        Only the ``last`` most recent steps are built when given; otherwise
+        every retained step is, which costs one dict per step.
+        """
+        start = 0 if last is None else max(len(self._pm_values) - last, 0)
+        return [
+            {'timestamp': datetime.fromtimestamp(ts), 'total_value': value, 'cash': cash, 'daily_pnl': pnl}
+            for ts, value, cash, pnl in zip(self._pm_times[start:], self._pm_values[start:],
+                                            self._pm_cash[start:], self._pm_pnl[start:])
+        ]
+    
+    @property
+    def performance_metrics(self) -> List[dict]:
+        """Every retained per-step performance record, oldest first.
         
-        if returns:
-            # Sharpe ratio (assuming 0% risk-free rate)
-            mean_return = statistics.mean(returns)
-            std_return = statistics.stdev(returns) if len(returns) > 1 else 0
-            self.portfolio.sharpe_ratio = mean_return / std_return if std_return > 0 else 0
-            
-            # Max drawdown
-            peak = self.performance_metrics[0]['total_value']
-            max_dd = 0
-            for metric in self.performance_metrics:
-                if metric['total_value'] > peak:
-                    peak = metric['total_value']
-                dd = (peak - metric['total_value']) / peak
-                max_dd = max(max_dd, dd)
-            self.portfolio.max_drawdown = max_dd
+        Kept for existing readers; each access builds the records afresh,
+        so prefer performance_records(last) when only the tail is needed.
+        """
+        return self.performance_records()
+    
+    def _calculate_advanced_metrics(self, prev_value: float, curr_value: float):
+        """Fold one new portfolio value into the running performance metrics."""
+        if prev_value > 0:
+            # Welford update of the return mean and sum of squared deviations
+            r = (curr_value - prev_value) / prev_value
+            self._n_returns += 1
+            delta = r - self._mean
+            self._mean += delta / self._n_returns
+            self._m2 += delta * (r - self._mean)
+            self._wins += r > 0
             
-            # Win rate
-            winning_days = sum(1 for r in returns if r > 0)
-            self.portfolio.win_rate = winning_days / len(returns) if returns else 0
+            # Sharpe ratio (assuming 0% risk-free rate)
+            variance = self._m2 / (self._n_returns - 1) if self._n_returns > 1 else 0
+            std_return = math.sqrt(variance) if variance > 0 else 0
+            self.portfolio.sharpe_ratio = self._mean / std_return if std_return > 0 else 0
+            self.portfolio.win_rate = self._wins / self._n_returns
+        
+        # Max drawdown against the running peak
+        if curr_value > self._peak:
+            self._peak = curr_value
+        if self._peak > 0:
+            dd = (self._peak - curr_value) / self._peak
+            if dd > self.portfolio.max_drawdown:
+                self.portfolio.max_drawdown = dd
     
-    def run_simulation_step(self):
-        """Run one step of the trading simulation."""
+    def run_simulation_step(self, now: Optional[datetime] = None):
+        """Run one step of the trading simulation at time ``now`` (default: the current time)."""
         if not self.running:
             return
         
+        # One clock reading stamps the whole step
+        if now is None:
+            now = datetime.now()
+        
         # Generate market data for all assets
-        for symbol in self.assets:
-            self.market_data[symbol] = self.generate_market_data(symbol)
+        market_data = self._batch_generate_market_data(now)
+        self.market_data.update(market_data)
+        # A copy: generate_market_data moves single base prices in place,
+        # which must not shift the prices positions are valued at
+        self._last_prices = list(self._base_prices)
         
-        # Generate signals and execute trades
-        for symbol in self.assets:
-            if symbol not in self.market_data:
-                continue
-            
-            data = self.market_data[symbol]
-            
-            # Get signals from all strategies
-            vwap_signal, vwap_confidence = self.strategies[symbol]['vwap'].generate_signal(data.price, data.volume)
-            mr_signal, mr_confidence = self.strategies[symbol]['mean_reversion'].generate_signal(data.price)
-            
-            # Combine signals (simple average for now)
-            if vwap_signal != "HOLD" and mr_signal != "HOLD":
-                if vwap_signal == mr_signal:
-                    # Both strategies agree - high confidence
-                    signal = vwap_signal
-                    confidence = (vwap_confidence + mr_confidence) / 2
-                else:
-                    # Strategies disagree - lower confidence
-                    signal = "HOLD"
-                    confidence = 0.0
-            else:
-                signal = vwap_signal if vwap_signal != "HOLD" else mr_signal
-                confidence = max(vwap_confidence, mr_confidence)
-            
-            # Execute trade if signal is strong enough
-            if signal != "HOLD" and confidence > 0.3:
+        # Get signals from all strategies; the batch is ordered by asset id,
+        # like the shared states and pre-bound strategy methods. Each state
+        # takes the tick once, before both strategies read it
+        vwap_signals = []
+        vwap_confidences = []
+        mr_signals = []
+        mr_confidences = []
+        for data, state, (vwap_generate, mr_generate) in zip(
+                market_data.values(), self._symbol_states, self._signal_generators):
+            state.update(data.price, data.volume)
+            signal, confidence = vwap_generate(data.price, data.volume)
+            vwap_signals.append(signal)
+            vwap_confidences.append(confidence)
+            signal, confidence = mr_generate(data.price)
+            mr_signals.append(signal)
+            mr_confidences.append(confidence)
+        
+        signals, confidences = combine_signals(vwap_signals, mr_signals, vwap_confidences, mr_confidences)
+        
+        # Execute trade if signal is strong enough
+        execute_trade = self.execute_trade
+        for (symbol, data), signal, confidence in zip(market_data.items(), signals, confidences):
+            if signal and confidence > 0.3:
                 quantity = int(1000 * confidence)  # Position size based on confidence
-                if signal == "BUY":
-                    self.execute_trade(symbol, "BUY", quantity, data.ask, "combined")
-                elif signal == "SELL":
-                    self.execute_trade(symbol, "SELL", quantity, data.bid, "combined")
+                if signal > 0:
+                    execute_trade(symbol, BUY, quantity, data.ask, COMBINED, now)
+                else:
+                    execute_trade(symbol, SELL, quantity, data.bid, COMBINED, now)
         
         # Update portfolio
-        self.update_portfolio_value()
+        self.update_portfolio_value(now)
     
     def start(self):
         """Start the trading simulation."""
@@ -557,8 +934,14 @@ class AdvancedTradingSimulator:
         self.running = False
         print("🛑 Advanced Trading Simulator Stopped")
     
+    def _sync_assets(self):
+        """Copy the live base prices back into the ``assets`` table."""
+        for symbol, price in zip(self._symbols, self._base_prices):
+            self.assets[symbol].base_price = price
+    
     def get_status(self) -> dict:
         """Get current simulator status."""
+        self._sync_assets()
         return {
             "running": self.running,
             "portfolio": {
@@ -571,7 +954,7 @@ class AdvancedTradingSimulator:
                 "win_rate": round(self.portfolio.win_rate * 100, 2)
             },
             "positions": {k: v for k, v in self.portfolio.positions.items() if v != 0},
-            "total_trades": len(self.trades),
+            "total_trades": self._trade_count,
             "assets_trading": len([k for k, v in self.portfolio.positions.items() if v != 0]),
             "timestamp": datetime.now().strftime("%H:%M:%S")
         }
@@ -581,8 +964,13 @@ class AdvancedTradingSimulator:
 advanced_simulator = AdvancedTradingSimulator()
 
 
-def run_advanced_simulation():
-    """Run the advanced simulation."""
+def run_advanced_simulation(n_ticks: Optional[int] = None, interval: float = 1.0):
+    """Run the advanced simulation.
+    
+    Runs ``n_ticks`` steps, or until interrupted when it is None.
+    ``interval`` is the target wall-clock spacing between steps in seconds;
+    an interval of 0 runs the steps back to back.
+    """
     print("🤖 Advanced AI Trading Simulator")
     print("=" * 60)
     print("📊 Multi-Asset Portfolio: Stocks, Crypto, Forex, Commodities")
@@ -594,19 +982,32 @@ def run_advanced_simulation():
     # Start simulator
     advanced_simulator.start()
     
+    # Steps run on a simulated clock that advances SIM_STEP per step and
+    # are paced against a monotonic deadline; the status output is paced by
+    # the wall clock separately
+    sim_time = datetime.now()
+    steps = 0
+    deadline = time.monotonic()
+    next_status = deadline + STATUS_INTERVAL
     try:
-        while advanced_simulator.running:
-            advanced_simulator.run_simulation_step()
+        while advanced_simulator.running and (n_ticks is None or steps < n_ticks):
+            advanced_simulator.run_simulation_step(sim_time)
+            sim_time += SIM_STEP
+            steps += 1
             
-            # Display status every 5 seconds
-            if len(advanced_simulator.performance_metrics) % 5 == 0:
+            # Display status every STATUS_INTERVAL seconds
+            if time.monotonic() >= next_status:
+                next_status += STATUS_INTERVAL
                 status = advanced_simulator.get_status()
-                print(f"\n[{status['timestamp']}] Portfolio: ${status['portfolio']['total_value']:,.2f} | "
+                print(f"\n[{status['timestamp']}] Sim time: {sim_time:%Y-%m-%d %H:%M:%S} ({steps:,} steps) | "
+                      f"Portfolio: ${status['portfolio']['total_value']:,.2f} | "
                       f"P&L: ${status['portfolio']['daily_pnl']:,.2f} | "
                       f"Trades: {status['total_trades']} | "
                       f"Sharpe: {status['portfolio']['sharpe_ratio']:.3f}")
             
-            time.sleep(1)
+            if interval > 0:
+                deadline += interval
+                _wait_for_deadline(deadline)
             
     except KeyboardInterrupt:
         print("\n⏹️  Simulation interrupted by user")
@@ -625,9 +1026,23 @@ def run_advanced_simulation():
     advanced_simulator.stop()
 
 
+def main():
+    """Command-line entry point for the advanced simulator."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Advanced multi-asset trading simulator")
+    parser.add_argument("--ticks", type=int, default=None,
+                        help="number of simulation steps to run (default: until interrupted)")
+    parser.add_argument("--interval", type=float, default=1.0,
+                        help="seconds between steps; 0 runs flat out (default: 1.0)")
+    args = parser.parse_args()
+    
+    run_advanced_simulation(args.ticks, args.interval)
+
+
 if __name__ == "__main__":
     try:
-        run_advanced_simulation()
+        main()
     except KeyboardInterrupt:
         print("\n\n⏹️  Simulation interrupted by user")
     except Exception as e: